@@ -7,10 +7,11 @@ Coordinates OBS client connection and system tray interface with persistent sett
 """
 
 import sys
+import queue
 import signal
 import logging
+import logging.handlers
 import threading
-import time
 from typing import Optional
 
 from src.settings_manager import SettingsManager
@@ -27,21 +28,37 @@ class OBSTrayApp:
         self.obs_client: Optional[OBSClient] = None
         self.tray_handler: Optional[TrayHandler] = None
         self.update_thread: Optional[threading.Thread] = None
-        self.running = False
+        self._stop_event = threading.Event()
+        self._shutdown_started = threading.Event()  # Set once shutdown() has begun
+        self._shutdown_guard = threading.Lock()  # Makes checking and setting it atomic
+        self._state_cv = threading.Condition()  # Notified on connection changes and stop
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
         self.logger = self._setup_logging()
         
     def _setup_logging(self) -> logging.Logger:
-        """Setup application logging."""
+        """
+        Setup application logging.
+        
+        Application threads only enqueue log records; a listener thread formats
+        them and writes to the output handlers.
+        """
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.StreamHandler(sys.stdout),
+            # Uncomment to also log to file:
+            # logging.FileHandler('obs_tray.log')
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
         # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                # Uncomment to also log to file:
-                # logging.FileHandler('obs_tray.log')
-            ]
-        )
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._log_listener.start()
         
         # Reduce noise from some libraries
         logging.getLogger('PIL').setLevel(logging.WARNING)
@@ -63,39 +80,81 @@ class OBSTrayApp:
                 self.logger.info("Connected to OBS - checking initial source state")
                 # Check initial source state
                 initial_state = self.obs_client.is_source_visible()
-                self.tray_handler.update_webcam_state(initial_state)
+                self._push_webcam_state(initial_state)
             else:
                 self.logger.warning("Disconnected from OBS")
-                self.tray_handler.update_webcam_state(None)
+                self._push_webcam_state(None)
+        
+        self._wake_update_loop()
+    
+    def _wake_update_loop(self):
+        """Wake the update loop so it re-checks the connection and stop state."""
+        with self._state_cv:
+            self._state_cv.notify_all()
+    
+    def _should_poll(self) -> bool:
+        """Check whether the update loop has work: connected to OBS, or stopping."""
+        return self._stop_event.is_set() or bool(
+            self.obs_client and self.obs_client.connected and
+            self.tray_handler and self.tray_handler.current_connection_state
+        )
+    
+    def _push_webcam_state(self, webcam_state: Optional[bool]):
+        """
+        Forward a webcam state to the tray handler if it differs from the shown state.
+        
+        Menu actions and hotkeys update the tray state directly, so the tray's
+        current state (not the last value pushed from here) is the baseline.
+        
+        Args:
+            webcam_state: True if webcam on, False if off, None if unknown
+        """
+        if self.tray_handler and webcam_state != self.tray_handler.current_webcam_state:
+            self.tray_handler.update_webcam_state(webcam_state)
                 
     def _update_loop(self):
         """Background thread that periodically updates the tray icon state."""
         self.logger.info("Started update loop thread")
         
-        while self.running:
+        while True:
+            # Sleep without waking while disconnected, until a connection change or stop
+            with self._state_cv:
+                self._state_cv.wait_for(self._should_poll)
+            if self._stop_event.is_set():
+                break
+            
             try:
-                if (self.obs_client and self.obs_client.connected and 
-                    self.tray_handler and self.tray_handler.current_connection_state):
-                    
-                    # Check current source state periodically
-                    current_state = self.obs_client.is_source_visible()
-                    self.tray_handler.update_webcam_state(current_state)
+                # Check current source state periodically
+                current_state = self.obs_client.is_source_visible()
+                self._push_webcam_state(current_state)
                     
             except Exception as e:
-                self.logger.error(f"Error in update loop: {e}")
+                self.logger.error("Error in update loop: %s", e)
                 
-            # Sleep for a bit before next update (every 5 seconds)
-            for _ in range(50):  # Check every 5 seconds (50 * 0.1s)
-                if not self.running:
-                    break
-                time.sleep(0.1)
+            # Wait before next update, waking immediately on shutdown. While OBS pushes
+            # visibility events this is only a sanity check; otherwise poll every 5 seconds.
+            interval = 60.0 if self.obs_client and self.obs_client.has_event_subscription() else 5.0
+            if self._stop_event.wait(interval):
+                break
+        
+        # Stopping the tray returns control to start(), which runs shutdown()
+        if not self._shutdown_started.is_set() and self.tray_handler:
+            self.logger.info("Stop requested, closing system tray interface")
+            self.tray_handler.stop()
                 
         self.logger.info("Update loop thread stopped")
     
     def _signal_handler(self, signum, frame):
-        """Handle system signals for graceful shutdown."""
-        self.logger.info(f"Received signal {signum}, shutting down gracefully...")
-        self.shutdown()
+        """
+        Handle system signals for graceful shutdown.
+        
+        Only flags the stop event and wakes the update loop, which reacts by
+        stopping the tray; shutdown() then runs on the main thread from start().
+        The condition's default RLock keeps this safe if the signal arrives while
+        the main thread holds it.
+        """
+        self._stop_event.set()
+        self._wake_update_loop()
         
     def start(self):
         """Start the application."""
@@ -104,9 +163,9 @@ class OBSTrayApp:
             self.settings_manager = SettingsManager()
             settings = self.settings_manager.settings
             
-            self.logger.info(f"Starting OBS VirtualCam Tray Controller")
-            self.logger.info(f"Settings loaded from: {self.settings_manager.config_file}")
-            self.logger.info(f"Auto-connect: {settings.auto_connect}")
+            self.logger.info("Starting OBS VirtualCam Tray Controller")
+            self.logger.info("Settings loaded from: %s", self.settings_manager.config_file)
+            self.logger.info("Auto-connect: %s", settings.auto_connect)
             
             # Setup signal handlers for graceful shutdown
             signal.signal(signal.SIGINT, self._signal_handler)
@@ -115,7 +174,8 @@ class OBSTrayApp:
             # Initialize OBS client
             self.obs_client = OBSClient(
                 settings_manager=self.settings_manager,
-                status_callback=self._on_obs_connection_change
+                status_callback=self._on_obs_connection_change,
+                state_callback=self._push_webcam_state
             )
             
             # Initialize tray handler
@@ -124,9 +184,6 @@ class OBSTrayApp:
                 settings_manager=self.settings_manager
             )
             
-            # Start the application components
-            self.running = True
-            
             # Auto-connect to OBS if enabled in settings
             if settings.auto_connect:
                 self.logger.info("Auto-connect enabled, attempting to connect to OBS...")
@@ -143,25 +200,30 @@ class OBSTrayApp:
             self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
             self.update_thread.start()
             
-            # Start tray icon (this blocks until exit)
-            self.logger.info("Starting system tray interface")
-            self.tray_handler.start()
+            # Start tray icon (this blocks until exit), unless a stop was already requested
+            if not self._stop_event.is_set():
+                self.logger.info("Starting system tray interface")
+                self.tray_handler.start()
             
         except KeyboardInterrupt:
             self.logger.info("Interrupted by user")
         except Exception as e:
-            self.logger.error(f"Application error: {e}")
+            self.logger.error("Application error: %s", e)
             raise
         finally:
             self.shutdown()
+            self._stop_logging()
     
     def shutdown(self):
         """Shutdown the application gracefully."""
-        if not self.running:
-            return
+        with self._shutdown_guard:
+            if self._shutdown_started.is_set():
+                return  # Already shut down or shutting down
+            self._shutdown_started.set()
             
         self.logger.info("Shutting down application...")
-        self.running = False
+        self._stop_event.set()
+        self._wake_update_loop()
         
         # Stop tray handler
         if self.tray_handler:
@@ -175,8 +237,18 @@ class OBSTrayApp:
         # Wait for update thread to finish
         if self.update_thread and self.update_thread.is_alive():
             self.update_thread.join(timeout=2.0)
+        
+        # Write any settings change still waiting for its debounced save
+        if self.settings_manager:
+            self.settings_manager.flush()
             
         self.logger.info("Application shutdown complete")
+    
+    def _stop_logging(self):
+        """Flush queued log records and stop the logging listener thread."""
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
 
 
 def main():
@@ -4,6 +4,7 @@ Simple build script for creating executable on current platform
 """
 
 import sys
+import argparse
 import subprocess
 import platform
 import shutil
@@ -11,6 +12,11 @@ import os
 from pathlib import Path
 
 def main():
+    parser = argparse.ArgumentParser(description="Build OBS VirtualCam Tray Controller executable")
+    parser.add_argument("--clean", action="store_true",
+                        help="Remove previous build output and PyInstaller cache for a full rebuild")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print(f"Building OBS VirtualCam Tray Controller for {platform.system()}")
     print("=" * 60)
@@ -23,15 +29,18 @@ def main():
     print("\nInstalling build requirements...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "config/requirements-build.txt"])
     
-    # Clean previous builds
-    print("\nCleaning previous builds...")
-    for dir_name in ["build", "dist"]:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
+    # Clean previous builds only when asked; otherwise PyInstaller reuses its analysis cache
+    pyinstaller_args = [sys.executable, "-m", "PyInstaller", "config/obs-tray.spec", "--noconfirm"]
+    if args.clean:
+        print("\nCleaning previous builds...")
+        for dir_name in ["build", "dist"]:
+            if Path(dir_name).exists():
+                shutil.rmtree(dir_name)
+        pyinstaller_args.append("--clean")
     
     # Build executable
     print("\nBuilding executable...")
-    subprocess.check_call([sys.executable, "-m", "PyInstaller", "config/obs-tray.spec", "--clean"])
+    subprocess.check_call(pyinstaller_args)
     
     # Report results
     print("\n" + "=" * 60)
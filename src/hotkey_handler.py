@@ -4,12 +4,18 @@ Manages keyboard shortcuts for webcam control.
 """
 
 import logging
+import sys
+import functools
 import threading
-from typing import Optional, Callable, Dict, Any
-from pynput import keyboard
-from pynput.keyboard import Key, GlobalHotKeys
+from typing import Optional, Callable, Dict, Any, Tuple, TYPE_CHECKING
 
-from .settings_manager import SettingsManager
+from .settings_manager import SettingsManager, Settings
+
+if TYPE_CHECKING:
+    from pynput.keyboard import GlobalHotKeys
+
+# macOS uses Command in place of Control for shortcuts
+_IS_DARWIN = sys.platform == "darwin"
 
 
 class HotkeyHandler:
@@ -23,16 +29,27 @@ class HotkeyHandler:
             settings_manager: Settings manager instance
         """
         self.settings_manager = settings_manager
+        self._settings = settings_manager.settings
         self.logger = logging.getLogger(__name__)
         
+        # Keep the settings snapshot current when settings are reset or imported
+        settings_manager.add_change_callback(self._on_settings_changed)
+        
         # Callbacks for hotkey actions
         self.webcam_on_callback: Optional[Callable[[], None]] = None
         self.webcam_off_callback: Optional[Callable[[], None]] = None
         
         # Global hotkeys listener
-        self.global_hotkeys: Optional[GlobalHotKeys] = None
+        self.global_hotkeys: Optional["GlobalHotKeys"] = None
         self.is_running = False
         
+        # Hotkey settings the listener was last started with, None when stopped
+        self._settings_fingerprint: Optional[Tuple[bool, str, str]] = None
+        
+    def _on_settings_changed(self, settings: Settings):
+        """Refresh the settings snapshot after a settings change."""
+        self._settings = settings
+    
     def set_callbacks(self, webcam_on_callback: Optional[Callable[[], None]] = None,
                      webcam_off_callback: Optional[Callable[[], None]] = None):
         """
@@ -47,7 +64,8 @@ class HotkeyHandler:
         if webcam_off_callback:
             self.webcam_off_callback = webcam_off_callback
     
-    def _parse_hotkey_string(self, hotkey_str: str) -> str:
+    @staticmethod
+    def _parse_hotkey_string(hotkey_str: str) -> str:
         """
         Parse hotkey string from settings format to pynput format.
         
@@ -59,8 +77,8 @@ class HotkeyHandler:
         """
         # Convert from settings format to pynput format
         # Settings format: "<ctrl>+<alt>+1"
-        # pynput format: "<ctrl>+<alt>+1"
-        return hotkey_str.replace("<ctrl>", "<cmd>") if "darwin" in str(self.settings_manager.config_dir) else hotkey_str
+        # pynput format: "<ctrl>+<alt>+1" ("<cmd>+<alt>+1" on macOS)
+        return hotkey_str.replace("<ctrl>", "<cmd>") if _IS_DARWIN else hotkey_str
     
     def _create_hotkeys_dict(self) -> Dict[str, Callable[[], None]]:
         """
@@ -70,7 +88,7 @@ class HotkeyHandler:
             Dict mapping hotkey strings to callback functions
         """
         hotkeys_dict = {}
-        settings = self.settings_manager.settings
+        settings = self._settings
         
         if not settings.enable_hotkeys:
             return hotkeys_dict
@@ -78,35 +96,44 @@ class HotkeyHandler:
         # Add webcam on hotkey
         if settings.hotkey_webcam_on:
             parsed_on = self._parse_hotkey_string(settings.hotkey_webcam_on)
-            hotkeys_dict[parsed_on] = self._on_webcam_on_hotkey
-            self.logger.info(f"Webcam ON hotkey: {parsed_on}")
+            hotkeys_dict[parsed_on] = functools.partial(self._dispatch, "ON")
+            self.logger.info("Webcam ON hotkey: %s", parsed_on)
         
         # Add webcam off hotkey
         if settings.hotkey_webcam_off:
             parsed_off = self._parse_hotkey_string(settings.hotkey_webcam_off)
-            hotkeys_dict[parsed_off] = self._on_webcam_off_hotkey
-            self.logger.info(f"Webcam OFF hotkey: {parsed_off}")
+            hotkeys_dict[parsed_off] = functools.partial(self._dispatch, "OFF")
+            self.logger.info("Webcam OFF hotkey: %s", parsed_off)
         
         return hotkeys_dict
     
-    def _on_webcam_on_hotkey(self):
-        """Handle webcam on hotkey press."""
-        try:
-            self.logger.info("Webcam ON hotkey pressed")
-            if self.webcam_on_callback:
-                self.webcam_on_callback()
-        except Exception as e:
-            self.logger.error(f"Error handling webcam on hotkey: {e}")
+    def _hotkey_fingerprint(self) -> Tuple[bool, str, str]:
+        """
+        Get the settings that determine the registered hotkeys.
+        
+        Returns:
+            Tuple of enable flag and the webcam on/off hotkey strings
+        """
+        settings = self._settings
+        return (settings.enable_hotkeys, settings.hotkey_webcam_on, settings.hotkey_webcam_off)
     
-    def _on_webcam_off_hotkey(self):
-        """Handle webcam off hotkey press."""
+    def _dispatch(self, which: str):
+        """
+        Handle a webcam hotkey press.
+        
+        The callback is looked up on each press, so set_callbacks() takes effect
+        without re-registering the hotkeys.
+        
+        Args:
+            which: "ON" or "OFF"
+        """
         try:
-            self.logger.info("Webcam OFF hotkey pressed")
-            if self.webcam_off_callback:
-                self.webcam_off_callback()
+            self.logger.info("Webcam %s hotkey pressed", which)
+            callback = self.webcam_on_callback if which == "ON" else self.webcam_off_callback
+            if callback:
+                callback()
         except Exception as e:
-            self.logger.error(f"Error handling webcam off hotkey: {e}")
-    
+            self.logger.error("Error handling webcam %s hotkey: %s", which.lower(), e)
     
     def start(self) -> bool:
         """
@@ -120,6 +147,8 @@ class HotkeyHandler:
             return True
         
         try:
+            self._settings_fingerprint = self._hotkey_fingerprint()
+            
             # Create hotkeys dictionary
             hotkeys_dict = self._create_hotkeys_dict()
             
@@ -127,20 +156,25 @@ class HotkeyHandler:
                 self.logger.info("No hotkeys configured, skipping hotkey listener")
                 return True
             
+            # Import pynput on first use; it loads its platform backend on import
+            from pynput.keyboard import GlobalHotKeys
+            
             # Create and start GlobalHotKeys listener
             self.global_hotkeys = GlobalHotKeys(hotkeys_dict)
             self.global_hotkeys.start()
             
             self.is_running = True
-            self.logger.info(f"Hotkey handler started successfully with {len(hotkeys_dict)} hotkeys")
+            self.logger.info("Hotkey handler started successfully with %s hotkeys", len(hotkeys_dict))
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to start hotkey handler: {e}")
+            self.logger.error("Failed to start hotkey handler: %s", e)
             return False
     
     def stop(self):
         """Stop the global hotkey listener."""
+        self._settings_fingerprint = None
+        
         if not self.is_running:
             return
         
@@ -155,19 +189,29 @@ class HotkeyHandler:
             self.logger.info("Hotkey handler stopped")
             
         except Exception as e:
-            self.logger.error(f"Error stopping hotkey handler: {e}")
+            self.logger.error("Error stopping hotkey handler: %s", e)
     
     def reload_hotkeys(self):
-        """Reload hotkeys from current settings."""
-        if self.is_running:
-            self.logger.info("Reloading hotkeys...")
-            self.stop()
-            self.start()
+        """Reload hotkeys from current settings if the hotkey settings changed since start."""
+        if self._settings_fingerprint is None:
+            return  # Not started
+        
+        if self._hotkey_fingerprint() == self._settings_fingerprint:
+            self.logger.debug("Hotkey settings unchanged, keeping current listener")
+            return
+        
+        self.logger.info("Reloading hotkeys...")
+        self.stop()
+        self.start()
     
-    def is_hotkey_valid(self, hotkey_str: str) -> bool:
+    @staticmethod
+    def is_hotkey_valid(hotkey_str: str) -> bool:
         """
         Check if a hotkey string is valid.
         
+        Needs no handler instance, so callers can validate without
+        registering a settings change callback.
+        
         Args:
             hotkey_str: Hotkey string to validate
             
@@ -175,8 +219,10 @@ class HotkeyHandler:
             bool: True if valid
         """
         try:
-            # Try to create a temporary GlobalHotKeys to validate
-            temp_hotkeys = GlobalHotKeys({self._parse_hotkey_string(hotkey_str): lambda: None})
+            from pynput.keyboard import HotKey
+            
+            # Parse only; constructing a GlobalHotKeys would also set up a listener
+            HotKey.parse(HotkeyHandler._parse_hotkey_string(hotkey_str))
             return True
         except Exception:
-            return False 
\ No newline at end of file
+            return False
\ No newline at end of file
@@ -5,56 +5,91 @@ Handles connection to OBS Studio and source visibility operations.
 
 import logging
 import asyncio
+import random
 import threading
-from typing import Optional, Callable
-import obsws_python as obs
+from typing import Optional, Callable, Dict, Any, TYPE_CHECKING
 
-from .settings_manager import SettingsManager
+from .settings_manager import SettingsManager, Settings
+
+if TYPE_CHECKING:
+    import obsws_python as obs
 
 
 class OBSClient:
     """OBS WebSocket client for managing source visibility."""
     
-    def __init__(self, settings_manager: SettingsManager, status_callback: Optional[Callable[[bool], None]] = None):
+    def __init__(self, settings_manager: SettingsManager, status_callback: Optional[Callable[[bool], None]] = None,
+                 state_callback: Optional[Callable[[Optional[bool]], None]] = None):
         """
         Initialize OBS client.
         
         Args:
             settings_manager: Settings manager instance
             status_callback: Callback function called when connection status changes
+            state_callback: Callback function called when OBS reports a source visibility change
         """
         self.settings_manager = settings_manager
-        self.ws: Optional[obs.ReqClient] = None
+        self._settings = settings_manager.settings
+        self.ws: Optional["obs.ReqClient"] = None
+        self.events: Optional["obs.EventClient"] = None
         self.connected = False
         self.status_callback = status_callback
+        self.state_callback = state_callback
         self.reconnect_thread: Optional[threading.Thread] = None
         self.should_reconnect = False
+        self._stop_event = threading.Event()
+        
+        # Cache of scene_name -> {source_name: sceneItemId}, valid for one connection
+        self._scene_items: Dict[str, Dict[str, int]] = {}
+        
+        # Serializes requests on the ReqClient, which is used from the update loop,
+        # tray and hotkey actions and the event thread
+        self._request_lock = threading.RLock()
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
         
-    def connect(self) -> bool:
+        # Keep the settings snapshot current when settings are reset or imported
+        settings_manager.add_change_callback(self._on_settings_changed)
+    
+    def _on_settings_changed(self, settings: Settings):
+        """Refresh the settings snapshot after a settings change."""
+        self._settings = settings
+        
+    def connect(self, timeout: Optional[float] = None) -> bool:
         """
         Connect to OBS WebSocket.
         
+        Args:
+            timeout: Connection timeout in seconds, defaults to the connect_timeout setting
+            
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
-            settings = self.settings_manager.settings
-            self.logger.info(f"Connecting to OBS at {settings.obs_host}:{settings.obs_port}")
+            # Import obsws-python on first connect; it is not needed until then
+            import obsws_python as obs
+            
+            settings = self._settings
+            if timeout is None:
+                timeout = settings.connect_timeout
+            self.logger.info("Connecting to OBS at %s:%s", settings.obs_host, settings.obs_port)
+            self._scene_items.clear()
             
             # Create WebSocket client using obsws-python
             self.ws = obs.ReqClient(
                 host=settings.obs_host,
                 port=settings.obs_port,
                 password=settings.obs_password,
-                timeout=5
+                timeout=timeout
             )
             
             # Test connection with a simple request
             version_info = self.ws.get_version()
-            self.logger.info(f"Connected to OBS WebSocket v{version_info.obs_web_socket_version}")
+            self.logger.info("Connected to OBS WebSocket v%s", version_info.obs_web_socket_version)
+            
+            # Subscribe to scene item events so visibility changes are pushed to us
+            self._start_event_client(timeout)
             
             self.connected = True
             
@@ -64,7 +99,7 @@ class OBSClient:
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to connect to OBS: {e}")
+            self.logger.error("Failed to connect to OBS: %s", e)
             self.connected = False
             if self.status_callback:
                 self.status_callback(False)
@@ -79,6 +114,9 @@ class OBSClient:
         """
         try:
             self.should_reconnect = False
+            self._stop_event.set()
+            self._scene_items.clear()
+            self._stop_event_client()
             
             if self.ws:
                 # obsws-python handles disconnection automatically when object is destroyed
@@ -92,8 +130,190 @@ class OBSClient:
                 
             return True
         except Exception as e:
-            self.logger.error(f"Error disconnecting from OBS: {e}")
+            self.logger.error("Error disconnecting from OBS: %s", e)
+            return False
+
+    def _start_event_client(self, timeout: float):
+        """
+        Start listening for scene item events from OBS.
+        
+        Failing to subscribe is not fatal; visibility is then only picked up by polling.
+        
+        Args:
+            timeout: Connection timeout in seconds
+        """
+        self._stop_event_client()
+        
+        try:
+            import obsws_python as obs
+            
+            settings = self._settings
+            self.events = obs.EventClient(
+                host=settings.obs_host,
+                port=settings.obs_port,
+                password=settings.obs_password,
+                timeout=timeout,
+                subs=obs.Subs.SCENEITEMS
+            )
+            self.events.callback.register([
+                self.on_scene_item_enable_state_changed,
+                self.on_scene_item_created,
+                self.on_scene_item_removed,
+                self.on_scene_item_list_reindexed,
+            ])
+            self.logger.info("Subscribed to OBS scene item events")
+            
+        except Exception as e:
+            self.logger.warning("Could not subscribe to OBS events, falling back to polling: %s", e)
+            self.events = None
+    
+    def _stop_event_client(self):
+        """Stop listening for OBS events."""
+        if not self.events:
+            return
+        
+        try:
+            self.events.callback.clear()
+            self.events.disconnect()
+        except Exception as e:
+            self.logger.error("Error closing OBS event client: %s", e)
+        finally:
+            self.events = None
+    
+    def has_event_subscription(self) -> bool:
+        """
+        Check whether OBS scene item events are still being received.
+        
+        obsws-python's event thread ends silently when OBS closes the socket; such a
+        dead subscription is torn down so callers fall back to polling.
+        
+        Returns:
+            bool: True if the event thread is running
+        """
+        events = self.events
+        if events is None:
             return False
+        
+        worker = getattr(events, 'worker', None)
+        if worker is not None and worker.is_alive():
+            return True
+        
+        self.logger.warning("OBS event subscription ended, falling back to polling")
+        self._stop_event_client()
+        return False
+    
+    def on_scene_item_enable_state_changed(self, data):
+        """
+        Handle the SceneItemEnableStateChanged event from OBS.
+        
+        obsws-python routes events by handler name, and calls this from its event thread.
+        
+        Args:
+            data: Event data with scene_name, scene_item_id and scene_item_enabled
+        """
+        settings = self._settings
+        if data.scene_name != settings.scene_name:
+            return
+        
+        item_id = self._scene_items.get(settings.scene_name, {}).get(settings.source_name)
+        if item_id is None:
+            # The scene's items changed since they were cached; look the source up again
+            try:
+                with self._request_lock:
+                    item_id = self._resolve_item_id(settings.scene_name, settings.source_name)
+            except Exception as e:
+                self.logger.debug("Could not resolve scene item for event: %s", e)
+                return
+        
+        if data.scene_item_id != item_id:
+            return
+        
+        self.logger.debug("Source '%s' enabled state changed to %s", settings.source_name, data.scene_item_enabled)
+        if self.state_callback:
+            self.state_callback(data.scene_item_enabled)
+    
+    def on_scene_item_created(self, data):
+        """Handle the SceneItemCreated event from OBS."""
+        self._invalidate_scene_items(data.scene_name)
+    
+    def on_scene_item_removed(self, data):
+        """Handle the SceneItemRemoved event from OBS."""
+        self._invalidate_scene_items(data.scene_name)
+    
+    def on_scene_item_list_reindexed(self, data):
+        """Handle the SceneItemListReindexed event from OBS."""
+        self._invalidate_scene_items(data.scene_name)
+    
+    def _invalidate_scene_items(self, scene_name: str):
+        """
+        Drop the cached scene item IDs for a scene.
+        
+        Args:
+            scene_name: Name of the scene whose items changed
+        """
+        if self._scene_items.pop(scene_name, None) is not None:
+            self.logger.debug("Scene items of '%s' changed, cache invalidated", scene_name)
+    
+    def _resolve_item_id(self, scene_name: str, source_name: str) -> int:
+        """
+        Resolve the scene item ID of a source, using the cache when possible.
+        
+        The first lookup in a scene caches the IDs of all its sources.
+        
+        Args:
+            scene_name: Name of the scene containing the source
+            source_name: Name of the source
+            
+        Returns:
+            int: The scene item ID
+            
+        Raises:
+            LookupError: If the source is not found in the scene
+        """
+        items = self._scene_items.get(scene_name)
+        if items is None or source_name not in items:
+            # Not cached yet, or the source may have been added since the scene was cached
+            scene_items = self.ws.get_scene_item_list(scene_name)
+            # Index in one pass; reversed so the first match wins if a source appears twice
+            items = {item['sourceName']: item['sceneItemId'] for item in reversed(scene_items.scene_items)}
+            self._scene_items[scene_name] = items
+        
+        if source_name in items:
+            return items[source_name]
+        
+        raise LookupError(f"Source '{source_name}' not found in scene '{scene_name}'")
+    
+    def _scene_item_request(self, request: Callable[[str, int], Any]) -> Any:
+        """
+        Run a request against the scene item of the configured source.
+        
+        If OBS rejects a cached scene item ID (e.g. the source was removed and
+        re-added), the ID is looked up again and the request retried once.
+        
+        Args:
+            request: Function called with the scene name and scene item ID
+            
+        Returns:
+            The result of the request
+            
+        Raises:
+            LookupError: If the source is not found in the scene
+        """
+        from obsws_python.error import OBSSDKRequestError
+        
+        settings = self._settings
+        
+        with self._request_lock:
+            was_cached = settings.scene_name in self._scene_items
+            
+            try:
+                return request(settings.scene_name, self._resolve_item_id(settings.scene_name, settings.source_name))
+            except OBSSDKRequestError:
+                if not was_cached:
+                    raise
+                self.logger.info("Cached scene item ID for '%s' is stale, refreshing", settings.source_name)
+                self._scene_items.pop(settings.scene_name, None)
+                return request(settings.scene_name, self._resolve_item_id(settings.scene_name, settings.source_name))
 
     def is_source_visible(self) -> Optional[bool]:
         """
@@ -107,27 +327,15 @@ class OBSClient:
             return None
             
         try:
-            settings = self.settings_manager.settings
-            
-            # Get scene item ID for the source
-            scene_items = self.ws.get_scene_item_list(settings.scene_name)
-            
-            source_item_id = None
-            for item in scene_items.scene_items:
-                if item['sourceName'] == settings.source_name:
-                    source_item_id = item['sceneItemId']
-                    break
-            
-            if source_item_id is None:
-                self.logger.error(f"Source '{settings.source_name}' not found in scene '{settings.scene_name}'")
-                return None
-            
             # Check if the scene item is enabled (visible)
-            item_enabled = self.ws.get_scene_item_enabled(settings.scene_name, source_item_id)
+            item_enabled = self._scene_item_request(self.ws.get_scene_item_enabled)
             return item_enabled.scene_item_enabled
             
+        except LookupError as e:
+            self.logger.error(str(e))
+            return None
         except Exception as e:
-            self.logger.error(f"Error checking source visibility: {e}")
+            self.logger.error("Error checking source visibility: %s", e)
             return None
 
     def toggle_source_visibility(self) -> bool:
@@ -142,36 +350,25 @@ class OBSClient:
             return False
             
         try:
-            settings = self.settings_manager.settings
-            
-            # Get current visibility state
-            current_state = self.is_source_visible()
-            if current_state is None:
-                return False
-            
-            # Get scene item ID
-            scene_items = self.ws.get_scene_item_list(settings.scene_name)
+            settings = self._settings
             
-            source_item_id = None
-            for item in scene_items.scene_items:
-                if item['sourceName'] == settings.source_name:
-                    source_item_id = item['sceneItemId']
-                    break
+            def toggle(scene_name: str, item_id: int) -> bool:
+                # Read the current state and flip it against the same scene item
+                current_state = self.ws.get_scene_item_enabled(scene_name, item_id).scene_item_enabled
+                self.ws.set_scene_item_enabled(scene_name, item_id, not current_state)
+                return not current_state
             
-            if source_item_id is None:
-                self.logger.error(f"Source '{settings.source_name}' not found in scene '{settings.scene_name}'")
-                return False
-            
-            # Toggle visibility
-            new_state = not current_state
-            self.ws.set_scene_item_enabled(settings.scene_name, source_item_id, new_state)
+            new_state = self._scene_item_request(toggle)
             
             action = "shown" if new_state else "hidden"
-            self.logger.info(f"Source '{settings.source_name}' {action}")
+            self.logger.info("Source '%s' %s", settings.source_name, action)
             return True
             
+        except LookupError as e:
+            self.logger.error(str(e))
+            return False
         except Exception as e:
-            self.logger.error(f"Error toggling source visibility: {e}")
+            self.logger.error("Error toggling source visibility: %s", e)
             return False
 
     def set_source_visibility(self, visible: bool) -> bool:
@@ -189,30 +386,22 @@ class OBSClient:
             return False
             
         try:
-            settings = self.settings_manager.settings
-            
-            # Get scene item ID
-            scene_items = self.ws.get_scene_item_list(settings.scene_name)
-            
-            source_item_id = None
-            for item in scene_items.scene_items:
-                if item['sourceName'] == settings.source_name:
-                    source_item_id = item['sceneItemId']
-                    break
-            
-            if source_item_id is None:
-                self.logger.error(f"Source '{settings.source_name}' not found in scene '{settings.scene_name}'")
-                return False
+            settings = self._settings
             
             # Set visibility
-            self.ws.set_scene_item_enabled(settings.scene_name, source_item_id, visible)
+            self._scene_item_request(
+                lambda scene_name, item_id: self.ws.set_scene_item_enabled(scene_name, item_id, visible)
+            )
             
             action = "shown" if visible else "hidden"
-            self.logger.info(f"Source '{settings.source_name}' {action}")
+            self.logger.info("Source '%s' %s", settings.source_name, action)
             return True
             
+        except LookupError as e:
+            self.logger.error(str(e))
+            return False
         except Exception as e:
-            self.logger.error(f"Error setting source visibility: {e}")
+            self.logger.error("Error setting source visibility: %s", e)
             return False
     
     def start_reconnect_loop(self):
@@ -221,29 +410,42 @@ class OBSClient:
             return
             
         self.should_reconnect = True
+        self._stop_event.clear()
         self.reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True)
         self.reconnect_thread.start()
     
     def stop_reconnect_loop(self):
         """Stop the reconnection loop."""
         self.should_reconnect = False
+        self._stop_event.set()
     
     def _reconnect_loop(self):
-        """Background reconnection loop."""
-        settings = self.settings_manager.settings
+        """
+        Background reconnection loop.
+        
+        Failed attempts back off exponentially from reconnect_delay up to 60 seconds,
+        with up to one second of random jitter.
+        """
+        attempt = 0
         
         while self.should_reconnect:
+            settings = self._settings
+            delay = settings.reconnect_delay
+            
             if not self.connected:
                 self.logger.info("Attempting to reconnect to OBS...")
-                if self.connect():
+                # Background retries fail fast; OBS on the other end is usually local
+                if self.connect(timeout=1):
+                    attempt = 0
                     continue
+                
+                delay = min(settings.reconnect_delay * (2 ** attempt), 60.0) + random.uniform(0, 1)
+                attempt = min(attempt + 1, 16)  # Keep the exponent bounded
+                self.logger.info("Next reconnect attempt in %.1f seconds", delay)
                     
-            # Wait before next reconnect attempt
-            delay_steps = int(settings.reconnect_delay * 10)
-            for _ in range(delay_steps):  # Check should_reconnect every 0.1s
-                if not self.should_reconnect:
-                    return
-                threading.Event().wait(0.1)
+            # Wait before next reconnect attempt, waking immediately on stop
+            if self._stop_event.wait(delay):
+                return
     
     def __enter__(self):
         """Context manager entry."""
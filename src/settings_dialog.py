@@ -4,35 +4,127 @@ Provides a GUI interface for editing application settings.
 """
 
 import logging
+import platform
+import re
+import subprocess
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import Optional, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import ttk, messagebox, filedialog, colorchooser
+from typing import Optional, Callable, Dict, Tuple
 from pathlib import Path
 
 from .settings_manager import SettingsManager
+from .hotkey_handler import HotkeyHandler
+
+# Hotkey syntax: "+"-joined <named> keys ending in a named key or a single character
+_HOTKEY_RE = re.compile(r'(?:<[a-z0-9_]+>\+)*(?:<[a-z0-9_]+>|[^\s+<>])', re.IGNORECASE)
+
+# File explorer command for opening the settings folder
+if platform.system() == "Windows":
+    _OPEN_FOLDER_CMD = 'explorer'
+elif platform.system() == "Darwin":  # macOS
+    _OPEN_FOLDER_CMD = 'open'
+else:  # Linux
+    _OPEN_FOLDER_CMD = 'xdg-open'
+
+# Non-negative decimal number, as accepted for delays and timeouts (e.g. 5, 2.5, .5, 5.)
+_NUMBER_RE = re.compile(r'[0-9]*\.?[0-9]+|[0-9]+\.')
+
+# Hex color code such as #00ff00
+_COLOR_RE = re.compile(r'#[0-9A-Fa-f]{6}')
+
+# Tk keysyms (lowercased) mapped to hotkey key names when recording
+_KEY_MAPPINGS = {
+    'control_l': 'ctrl', 'control_r': 'ctrl',
+    'alt_l': 'alt', 'alt_r': 'alt',
+    'shift_l': 'shift', 'shift_r': 'shift',
+    'super_l': 'win', 'super_r': 'win',
+    'return': 'enter', 'backspace': 'backspace',
+    'delete': 'delete', 'escape': 'escape',
+    'tab': 'tab', 'space': 'space'
+}
+
+# Arrow and navigation keys accepted as-is when recording
+_NAV_KEYS = frozenset({'up', 'down', 'left', 'right', 'home', 'end', 'pageup', 'pagedown', 'insert'})
+
+# Tk event state bits for modifiers, in hotkey order (the Windows key bit varies by system)
+_MOD_BITS = ((0x4, '<ctrl>'), (0x8, '<alt>'), (0x1, '<shift>'), (0x40000, '<win>'))
+_MOD_MASK = 0x4 | 0x8 | 0x1 | 0x40000
+
+# Modifier tuples by masked event state, filled as states are seen
+_MOD_CACHE: Dict[int, Tuple[str, ...]] = {}
 
 
 class SettingsDialog:
     """Settings dialog window with editable configuration fields."""
     
-    def __init__(self, settings_manager: SettingsManager, on_settings_changed: Optional[Callable] = None):
+    # Form fields and how each setting value is shown in its widget
+    _FIELDS = (
+        ('obs_host', str),
+        ('obs_port', str),
+        ('obs_password', lambda value: value or ""),
+        ('scene_name', str),
+        ('source_name', str),
+        ('reconnect_delay', str),
+        ('connect_timeout', str),
+        ('auto_connect', bool),
+        ('start_minimized', bool),
+        ('camera_on_color', str),
+        ('camera_off_color', str),
+        ('enable_hotkeys', bool),
+        ('hotkey_webcam_on', str),
+        ('hotkey_webcam_off', str),
+    )
+    
+    # Field names as shown in messages
+    _DISPLAY_NAMES = {
+        'camera_on_color': 'Camera On Color',
+        'camera_off_color': 'Camera Off Color',
+        'hotkey_webcam_on': 'Webcam ON',
+        'hotkey_webcam_off': 'Webcam OFF',
+    }
+    
+    def __init__(self, settings_manager: SettingsManager, on_settings_changed: Optional[Callable] = None,
+                 parent: Optional[tk.Misc] = None):
         """
         Initialize settings dialog.
         
         Args:
             settings_manager: Settings manager instance
             on_settings_changed: Callback when settings are changed
+            parent: Existing Tk widget to open the dialog on; a new Tk root is created if None
         """
         self.settings_manager = settings_manager
         self.on_settings_changed = on_settings_changed
+        self.parent = parent
         self.logger = logging.getLogger(__name__)
         
-        # Dialog window
-        self.root: Optional[tk.Tk] = None
+        # Dialog window, created on first show and hidden between shows
+        self.root: Optional[tk.Misc] = None
+        self._closed: Optional[tk.BooleanVar] = None
+        self._status_label: Optional[ttk.Label] = None
         self.result = False  # True if settings were saved
         
-        # Form variables
-        self.vars = {}
+        # Form widgets by setting name
+        self.widgets = {}
+        
+        # Notebook tabs are built on first view; values for fields of unbuilt tabs wait here
+        self._notebook: Optional[ttk.Notebook] = None
+        self._tab_builders = {}
+        self._built_tabs = set()
+        self._pending_values = {}
+        
+        # Hotkey recording window, created on first use and hidden between recordings
+        self._record_window: Optional[tk.Toplevel] = None
+        self._record_target = ""
+        self._recorded_hotkey = ""
+        
+        # Worker for file and process operations, so they don't block the Tk event loop.
+        # It lives as long as the dialog window, which is reused between shows.
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Pending result checks (Tk after ids) of background operations, by future
+        self._pending_polls: Dict[Future, str] = {}
         
     def show(self) -> bool:
         """
@@ -41,65 +133,97 @@ class SettingsDialog:
         Returns:
             bool: True if settings were saved, False if cancelled
         """
+        if self.root is not None and not self._closed.get():
+            # Already showing; bring it to the front instead of waiting twice
+            self.root.lift()
+            return False
+        
         try:
-            self._create_dialog()
-            self._populate_fields()
-            self._center_window()
+            self.result = False
+            if self.root is None:
+                # Load values first so each tab's fields are filled as the tab is built
+                self._populate_fields()
+                self._create_dialog()
+            else:
+                self._status_label.configure(text="")
+                self._populate_fields()
+                self.root.deiconify()
             
-            # Show dialog and wait for result
-            self.root.wait_window()
+            # Show dialog and wait until it is closed (hidden) again
+            self._closed.set(False)
+            self.root.wait_variable(self._closed)
             
             return self.result
             
         except Exception as e:
-            self.logger.error(f"Error showing settings dialog: {e}")
+            self.logger.error("Error showing settings dialog: %s", e)
             if self.root:
                 self.root.destroy()
+                self.root = None
+                
+                # Drop widget state of the destroyed window
+                self.widgets = {}
+                self._tab_builders = {}
+                self._built_tabs = set()
+                self._record_window = None
             return False
     
     def _create_dialog(self):
         """Create the dialog window and widgets."""
-        self.root = tk.Tk()
+        self.root = tk.Toplevel(self.parent) if self.parent else tk.Tk()
         self.root.title("OBS Tray Controller - Settings")
-        self.root.geometry("500x600")
+        
+        # Set by _close() to end show(); closing the window hides it instead of destroying it
+        self._closed = tk.BooleanVar(self.root, value=True)
+        self.root.protocol('WM_DELETE_WINDOW', self._cancel)
+        self.root.bind('<Destroy>', self._on_destroy, add='+')
+        
+        # Size is fixed, so the window can be centered without a layout pass
+        width, height = 500, 600
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
         self.root.resizable(False, False)
         
-        # Make it a modal dialog
-        self.root.transient()
-        self.root.grab_set()
+        # Stay above the parent window; show() blocking the caller keeps it modal without a grab
+        # (a window transient to a hidden parent would be hidden too)
+        if self.parent is not None and self.parent.winfo_viewable():
+            self.root.transient(self.parent)
         
         # Create main frame with scrollbar
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Label styles shared by all tabs
+        style = ttk.Style(self.root)
+        style.configure('Help.TLabel', font=('TkDefaultFont', 8), foreground='gray')
+        style.configure('Info.TLabel', font=('TkDefaultFont', 8), foreground='blue')
+        style.configure('Bold.TLabel', font=('TkDefaultFont', 9, 'bold'))
+        style.configure('Status.TLabel', foreground='green')
+        
         # Create notebook for organized settings
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        
-        # Connection settings tab
-        conn_frame = ttk.Frame(notebook)
-        notebook.add(conn_frame, text="Connection")
-        self._create_connection_tab(conn_frame)
-        
-        # OBS settings tab
-        obs_frame = ttk.Frame(notebook)
-        notebook.add(obs_frame, text="OBS Settings")
-        self._create_obs_tab(obs_frame)
-        
-        # Application settings tab
-        app_frame = ttk.Frame(notebook)
-        notebook.add(app_frame, text="Application")
-        self._create_app_tab(app_frame)
-        
-        # Appearance settings tab
-        appearance_frame = ttk.Frame(notebook)
-        notebook.add(appearance_frame, text="Appearance")
-        self._create_appearance_tab(appearance_frame)
-        
-        # Hotkeys settings tab
-        hotkeys_frame = ttk.Frame(notebook)
-        notebook.add(hotkeys_frame, text="Hotkeys")
-        self._create_hotkeys_tab(hotkeys_frame)
+        self._notebook = notebook
+        
+        # Tabs are added empty and filled in by their builder the first time they are shown
+        tabs = [
+            ("Connection", self._create_connection_tab),
+            ("OBS Settings", self._create_obs_tab),
+            ("Application", self._create_app_tab),
+            ("Appearance", self._create_appearance_tab),
+            ("Hotkeys", self._create_hotkeys_tab),
+        ]
+        for text, builder in tabs:
+            frame = ttk.Frame(notebook)
+            # The window size is fixed; don't let each packed section resize the tab
+            frame.pack_propagate(False)
+            notebook.add(frame, text=text)
+            self._tab_builders[frame] = builder
+        
+        # Build the initially visible (Connection) tab right away
+        self._build_tab(notebook.nametowidget(notebook.tabs()[0]))
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -113,94 +237,166 @@ class SettingsDialog:
         # File location info
         info_frame = ttk.Frame(main_frame)
         info_frame.pack(fill=tk.X, pady=(5, 0))
-        ttk.Label(info_frame, text=f"Settings file: {self.settings_manager.config_file}", 
-                 font=('TkDefaultFont', 8), foreground='gray').pack()
+        self._status_label = ttk.Label(info_frame, text="", style='Status.TLabel')
+        self._status_label.pack()
+        ttk.Label(info_frame, text=f"Settings file: {self.settings_manager.config_file}", style='Help.TLabel').pack()
+    
+    def _on_tab_changed(self, event):
+        """Build the selected notebook tab the first time it is shown."""
+        self._build_tab(self.root.nametowidget(self._notebook.select()))
+    
+    def _build_tab(self, frame):
+        """
+        Build the widgets of a notebook tab if not built yet.
+        
+        Args:
+            frame: Tab frame to build
+        """
+        if frame in self._built_tabs:
+            return
+        
+        self._built_tabs.add(frame)
+        self._tab_builders[frame](frame)
+        self._flush_pending_values()
+    
+    def _flush_pending_values(self):
+        """Move pending field values into the form widgets that exist now."""
+        for name in self.widgets:
+            if name in self._pending_values:
+                self._set_value(name, self._pending_values.pop(name))
+    
+    def _set_value(self, name: str, value):
+        """
+        Set the value shown by a form widget.
+        
+        Args:
+            name: Setting name of the field
+            value: Text for entries, bool for checkbuttons
+        """
+        widget = self.widgets[name]
+        if isinstance(widget, ttk.Checkbutton):
+            widget.state(['!alternate', 'selected' if value else '!selected'])
+        else:
+            widget.delete(0, tk.END)
+            widget.insert(0, value)
+    
+    def _get_value(self, name: str):
+        """
+        Get the current value of a form field.
+        
+        Args:
+            name: Setting name of the field
+            
+        Returns:
+            The form widget's value, or the pending value if its tab is not built yet
+        """
+        widget = self.widgets.get(name)
+        if widget is None:
+            return self._pending_values[name]
+        if isinstance(widget, ttk.Checkbutton):
+            return widget.instate(['selected'])
+        return widget.get()
+    
+    @staticmethod
+    def _section(parent, title: str) -> ttk.Frame:
+        """
+        Add a titled section to a tab.
+        
+        Args:
+            parent: Tab frame to add the section to
+            title: Section heading
+            
+        Returns:
+            ttk.Frame: Frame to place the section's widgets in
+        """
+        ttk.Label(parent, text=title, style='Bold.TLabel').pack(anchor=tk.W, padx=10, pady=(10, 2))
+        body = ttk.Frame(parent)
+        body.pack(fill=tk.X, padx=20, pady=(0, 5))
+        return body
     
     def _create_connection_tab(self, parent):
         """Create connection settings tab."""
         # OBS WebSocket section
-        group = ttk.LabelFrame(parent, text="OBS WebSocket Connection", padding=10)
-        group.pack(fill=tk.X, padx=10, pady=5)
+        group = self._section(parent, "OBS WebSocket Connection")
         
         # Host
         ttk.Label(group, text="Host:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['obs_host'] = tk.StringVar()
-        ttk.Entry(group, textvariable=self.vars['obs_host'], width=30).grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        self.widgets['obs_host'] = ttk.Entry(group, width=30)
+        self.widgets['obs_host'].grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Port
         ttk.Label(group, text="Port:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['obs_port'] = tk.StringVar()
-        ttk.Entry(group, textvariable=self.vars['obs_port'], width=30).grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        self.widgets['obs_port'] = ttk.Entry(group, width=30)
+        self.widgets['obs_port'].grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Password
         ttk.Label(group, text="Password:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.vars['obs_password'] = tk.StringVar()
-        password_entry = ttk.Entry(group, textvariable=self.vars['obs_password'], show="*", width=30)
+        password_entry = ttk.Entry(group, show="*", width=30)
+        self.widgets['obs_password'] = password_entry
         password_entry.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Show password checkbox
-        self.vars['show_password'] = tk.BooleanVar()
-        show_cb = ttk.Checkbutton(group, text="Show password", variable=self.vars['show_password'],
-                                 command=lambda: password_entry.configure(show="" if self.vars['show_password'].get() else "*"))
+        show_cb = ttk.Checkbutton(group, text="Show password",
+                                 command=lambda: password_entry.configure(show="" if show_cb.instate(['selected']) else "*"))
+        show_cb.state(['!alternate'])
         show_cb.grid(row=3, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Help text
         help_text = "Get the password from OBS → Tools → WebSocket Server Settings"
-        ttk.Label(group, text=help_text, font=('TkDefaultFont', 8), foreground='gray').grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        ttk.Label(group, text=help_text, style='Help.TLabel').grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
     
     def _create_obs_tab(self, parent):
         """Create OBS settings tab."""
         # Scene and Source section
-        group = ttk.LabelFrame(parent, text="Scene and Source Configuration", padding=10)
-        group.pack(fill=tk.X, padx=10, pady=5)
+        group = self._section(parent, "Scene and Source Configuration")
         
         # Scene name
         ttk.Label(group, text="Scene Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['scene_name'] = tk.StringVar()
-        ttk.Entry(group, textvariable=self.vars['scene_name'], width=30).grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        self.widgets['scene_name'] = ttk.Entry(group, width=30)
+        self.widgets['scene_name'].grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Source name
         ttk.Label(group, text="Source Name:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['source_name'] = tk.StringVar()
-        ttk.Entry(group, textvariable=self.vars['source_name'], width=30).grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        self.widgets['source_name'] = ttk.Entry(group, width=30)
+        self.widgets['source_name'].grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Help text
         help_text = "These must match exactly with your OBS scene and source names"
-        ttk.Label(group, text=help_text, font=('TkDefaultFont', 8), foreground='gray').grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        ttk.Label(group, text=help_text, style='Help.TLabel').grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
         
         # Connection behavior section
-        conn_group = ttk.LabelFrame(parent, text="Connection Behavior", padding=10)
-        conn_group.pack(fill=tk.X, padx=10, pady=5)
+        conn_group = self._section(parent, "Connection Behavior")
         
         # Auto connect
-        self.vars['auto_connect'] = tk.BooleanVar()
-        ttk.Checkbutton(conn_group, text="Connect to OBS automatically on startup", 
-                       variable=self.vars['auto_connect']).grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.widgets['auto_connect'] = ttk.Checkbutton(conn_group, text="Connect to OBS automatically on startup")
+        self.widgets['auto_connect'].grid(row=0, column=0, sticky=tk.W, pady=2)
         
         # Reconnect delay
         ttk.Label(conn_group, text="Reconnect Delay (seconds):").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['reconnect_delay'] = tk.StringVar()
-        ttk.Entry(conn_group, textvariable=self.vars['reconnect_delay'], width=10).grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        self.widgets['reconnect_delay'] = ttk.Entry(conn_group, width=10)
+        self.widgets['reconnect_delay'].grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        
+        # Connect timeout
+        ttk.Label(conn_group, text="Connect Timeout (seconds):").grid(row=2, column=0, sticky=tk.W, pady=2)
+        self.widgets['connect_timeout'] = ttk.Entry(conn_group, width=10)
+        self.widgets['connect_timeout'].grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=2)
     
     def _create_app_tab(self, parent):
         """Create application settings tab."""
         # Application behavior
-        group = ttk.LabelFrame(parent, text="Application Behavior", padding=10)
-        group.pack(fill=tk.X, padx=10, pady=5)
+        group = self._section(parent, "Application Behavior")
         
         # Start minimized
-        self.vars['start_minimized'] = tk.BooleanVar()
-        ttk.Checkbutton(group, text="Start minimized to system tray", 
-                       variable=self.vars['start_minimized']).grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.widgets['start_minimized'] = ttk.Checkbutton(group, text="Start minimized to system tray")
+        self.widgets['start_minimized'].grid(row=0, column=0, sticky=tk.W, pady=2)
         
         # Settings file section
-        file_group = ttk.LabelFrame(parent, text="Settings File", padding=10)
-        file_group.pack(fill=tk.X, padx=10, pady=5)
+        file_group = self._section(parent, "Settings File")
         
         # Current file location
         file_location = str(self.settings_manager.config_file)
-        ttk.Label(file_group, text="Current location:", font=('TkDefaultFont', 9, 'bold')).grid(row=0, column=0, sticky=tk.W, pady=2)
-        location_label = ttk.Label(file_group, text=file_location, font=('TkDefaultFont', 8), foreground='blue')
+        ttk.Label(file_group, text="Current location:", style='Bold.TLabel').grid(row=0, column=0, sticky=tk.W, pady=2)
+        location_label = ttk.Label(file_group, text=file_location, style='Info.TLabel')
         location_label.grid(row=1, column=0, sticky=tk.W, pady=2)
         
         # Buttons for file operations
@@ -214,42 +410,40 @@ class SettingsDialog:
     def _create_appearance_tab(self, parent):
         """Create appearance settings tab."""
         # Icon colors section
-        group = ttk.LabelFrame(parent, text="Tray Icon Colors", padding=10)
-        group.pack(fill=tk.X, padx=10, pady=5)
+        group = self._section(parent, "Tray Icon Colors")
         
         # Camera on color
         ttk.Label(group, text="Camera ON Color:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['camera_on_color'] = tk.StringVar()
         color_frame1 = ttk.Frame(group)
         color_frame1.grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
-        ttk.Entry(color_frame1, textvariable=self.vars['camera_on_color'], width=10).pack(side=tk.LEFT)
+        self.widgets['camera_on_color'] = ttk.Entry(color_frame1, width=10)
+        self.widgets['camera_on_color'].pack(side=tk.LEFT)
         ttk.Button(color_frame1, text="Choose", command=lambda: self._choose_color('camera_on_color'), width=8).pack(side=tk.LEFT, padx=(5, 0))
         
         # Camera off color
         ttk.Label(group, text="Camera OFF Color:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['camera_off_color'] = tk.StringVar()
         color_frame2 = ttk.Frame(group)
         color_frame2.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
-        ttk.Entry(color_frame2, textvariable=self.vars['camera_off_color'], width=10).pack(side=tk.LEFT)
+        self.widgets['camera_off_color'] = ttk.Entry(color_frame2, width=10)
+        self.widgets['camera_off_color'].pack(side=tk.LEFT)
         ttk.Button(color_frame2, text="Choose", command=lambda: self._choose_color('camera_off_color'), width=8).pack(side=tk.LEFT, padx=(5, 0))
         
         # Color help
         help_text = "Use hex color codes (e.g., #4CAF50 for green, #F44336 for red)"
-        ttk.Label(group, text=help_text, font=('TkDefaultFont', 8), foreground='gray').grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        ttk.Label(group, text=help_text, style='Help.TLabel').grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
     
     def _create_hotkeys_tab(self, parent):
         """Create hotkeys settings tab."""
         # Enable hotkeys section
-        group = ttk.LabelFrame(parent, text="Global Keyboard Shortcuts", padding=10)
-        group.pack(fill=tk.X, padx=10, pady=5)
+        group = self._section(parent, "Global Keyboard Shortcuts")
         
         # Enable hotkeys checkbox
-        self.vars['enable_hotkeys'] = tk.BooleanVar()
-        ttk.Checkbutton(group, text="Enable global hotkeys", variable=self.vars['enable_hotkeys']).pack(anchor=tk.W, pady=2)
+        self.widgets['enable_hotkeys'] = ttk.Checkbutton(group, text="Enable global hotkeys")
+        self.widgets['enable_hotkeys'].pack(anchor=tk.W, pady=2)
         
         # Help text
         help_text = "When enabled, these keyboard shortcuts work globally (even when OBS Tray Controller is not focused)"
-        ttk.Label(group, text=help_text, font=('TkDefaultFont', 8), foreground='gray').pack(anchor=tk.W, pady=(2, 8))
+        ttk.Label(group, text=help_text, style='Help.TLabel').pack(anchor=tk.W, pady=(2, 8))
         
         # Hotkey settings
         hotkey_frame = ttk.Frame(group)
@@ -257,126 +451,114 @@ class SettingsDialog:
         
         # Webcam ON hotkey
         ttk.Label(hotkey_frame, text="Turn Webcam ON:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.vars['hotkey_webcam_on'] = tk.StringVar()
         on_frame = ttk.Frame(hotkey_frame)
         on_frame.grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
-        self.hotkey_on_entry = ttk.Entry(on_frame, textvariable=self.vars['hotkey_webcam_on'], width=20)
+        self.hotkey_on_entry = ttk.Entry(on_frame, width=20)
+        self.widgets['hotkey_webcam_on'] = self.hotkey_on_entry
         self.hotkey_on_entry.pack(side=tk.LEFT)
         ttk.Button(on_frame, text="Record", command=lambda: self._record_hotkey('hotkey_webcam_on'), width=8).pack(side=tk.LEFT, padx=(5, 0))
         
         # Webcam OFF hotkey  
         ttk.Label(hotkey_frame, text="Turn Webcam OFF:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.vars['hotkey_webcam_off'] = tk.StringVar()
         off_frame = ttk.Frame(hotkey_frame)
         off_frame.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=2)
-        self.hotkey_off_entry = ttk.Entry(off_frame, textvariable=self.vars['hotkey_webcam_off'], width=20)
+        self.hotkey_off_entry = ttk.Entry(off_frame, width=20)
+        self.widgets['hotkey_webcam_off'] = self.hotkey_off_entry
         self.hotkey_off_entry.pack(side=tk.LEFT)
         ttk.Button(off_frame, text="Record", command=lambda: self._record_hotkey('hotkey_webcam_off'), width=8).pack(side=tk.LEFT, padx=(5, 0))
         
         # Hotkey format help
         format_help = "Format: <ctrl>+<alt>+1 or <ctrl>+<shift>+f1\nSupported keys: ctrl, alt, shift, win, a-z, 0-9, f1-f12"
-        ttk.Label(group, text=format_help, font=('TkDefaultFont', 8), foreground='gray').pack(anchor=tk.W, pady=(8, 0))
+        ttk.Label(group, text=format_help, style='Help.TLabel').pack(anchor=tk.W, pady=(8, 0))
     
     def _populate_fields(self):
         """Populate form fields with current settings."""
         settings = self.settings_manager.settings
         
-        # Populate all fields
-        self.vars['obs_host'].set(settings.obs_host)
-        self.vars['obs_port'].set(str(settings.obs_port))
-        self.vars['obs_password'].set(settings.obs_password or "")
-        self.vars['scene_name'].set(settings.scene_name)
-        self.vars['source_name'].set(settings.source_name)
-        self.vars['reconnect_delay'].set(str(settings.reconnect_delay))
-        self.vars['auto_connect'].set(settings.auto_connect)
-        self.vars['start_minimized'].set(settings.start_minimized)
-        self.vars['camera_on_color'].set(settings.camera_on_color)
-        self.vars['camera_off_color'].set(settings.camera_off_color)
-        self.vars['enable_hotkeys'].set(settings.enable_hotkeys)
-        self.vars['hotkey_webcam_on'].set(settings.hotkey_webcam_on)
-        self.vars['hotkey_webcam_off'].set(settings.hotkey_webcam_off)
-    
-    def _center_window(self):
-        """Center the dialog window on screen."""
-        if self.root:
-            self.root.update_idletasks()
-            width = self.root.winfo_width()
-            height = self.root.winfo_height()
-            x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-            y = (self.root.winfo_screenheight() // 2) - (height // 2)
-            self.root.geometry(f"{width}x{height}+{x}+{y}")
+        # Values for all fields; fields of tabs not built yet receive them when built
+        self._pending_values = {name: convert(getattr(settings, name)) for name, convert in self._FIELDS}
+        self._flush_pending_values()
     
     def _choose_color(self, var_name: str):
         """Open color chooser dialog."""
         try:
-            from tkinter import colorchooser
-            current_color = self.vars[var_name].get()
+            current_color = self._get_value(var_name)
             color = colorchooser.askcolor(color=current_color, title="Choose Color")
             if color[1]:  # color[1] is the hex value
-                self.vars[var_name].set(color[1])
+                self._set_value(var_name, color[1])
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open color chooser: {e}")
     
     def _validate_settings(self) -> bool:
         """Validate all settings before saving."""
-        try:
-            # Validate port
-            port = int(self.vars['obs_port'].get())
-            if not (1 <= port <= 65535):
-                messagebox.showerror("Validation Error", "Port must be between 1 and 65535")
-                return False
-            
-            # Validate reconnect delay
-            delay = float(self.vars['reconnect_delay'].get())
-            if delay < 0:
-                messagebox.showerror("Validation Error", "Reconnect delay cannot be negative")
+        # Validate port; checked as digits first so bad input needs no exception
+        port = self._get_value('obs_port').strip()
+        if not (port.isascii() and port.isdigit() and 1 <= int(port) <= 65535):
+            messagebox.showerror("Validation Error", "Port must be a number between 1 and 65535")
+            return False
+        
+        # Validate reconnect delay
+        if not _NUMBER_RE.fullmatch(self._get_value('reconnect_delay').strip()):
+            messagebox.showerror("Validation Error", "Reconnect delay must be a non-negative number")
+            return False
+        
+        # Validate connect timeout
+        timeout = self._get_value('connect_timeout').strip()
+        if not (_NUMBER_RE.fullmatch(timeout) and float(timeout) > 0):
+            messagebox.showerror("Validation Error", "Connect timeout must be a number greater than zero")
+            return False
+        
+        # Validate required fields
+        if not self._get_value('obs_host').strip():
+            messagebox.showerror("Validation Error", "Host cannot be empty")
+            return False
+        
+        if not self._get_value('scene_name').strip():
+            messagebox.showerror("Validation Error", "Scene name cannot be empty")
+            return False
+        
+        if not self._get_value('source_name').strip():
+            messagebox.showerror("Validation Error", "Source name cannot be empty")
+            return False
+        
+        # Validate color codes
+        for color_var in ['camera_on_color', 'camera_off_color']:
+            color = self._get_value(color_var).strip()
+            if color and not _COLOR_RE.fullmatch(color):
+                messagebox.showerror("Validation Error", f"Invalid color format for {self._DISPLAY_NAMES[color_var]}")
                 return False
-            
-            # Validate required fields
-            if not self.vars['obs_host'].get().strip():
-                messagebox.showerror("Validation Error", "Host cannot be empty")
+        
+        # Validate hotkeys if enabled
+        if self._get_value('enable_hotkeys'):
+            hotkey_on = self._get_value('hotkey_webcam_on').strip()
+            hotkey_off = self._get_value('hotkey_webcam_off').strip()
+        
+            if hotkey_on and not self._is_hotkey_valid(hotkey_on):
+                messagebox.showerror("Validation Error", f"Invalid hotkey format for webcam ON: {hotkey_on}")
                 return False
-            
-            if not self.vars['scene_name'].get().strip():
-                messagebox.showerror("Validation Error", "Scene name cannot be empty")
+        
+            if hotkey_off and not self._is_hotkey_valid(hotkey_off):
+                messagebox.showerror("Validation Error", f"Invalid hotkey format for webcam OFF: {hotkey_off}")
                 return False
-            
-            if not self.vars['source_name'].get().strip():
-                messagebox.showerror("Validation Error", "Source name cannot be empty")
+        
+            if hotkey_on and hotkey_off and hotkey_on == hotkey_off:
+                messagebox.showerror("Validation Error", "Webcam ON and OFF hotkeys cannot be the same")
                 return False
+        
+        return True
+    
+    @staticmethod
+    def _is_hotkey_valid(hotkey: str) -> bool:
+        """
+        Check a hotkey string, rejecting malformed ones before asking pynput.
+        
+        Args:
+            hotkey: Hotkey string from the form
             
-            # Validate color codes
-            for color_var in ['camera_on_color', 'camera_off_color']:
-                color = self.vars[color_var].get().strip()
-                if color and not (color.startswith('#') and len(color) == 7):
-                    messagebox.showerror("Validation Error", f"Invalid color format for {color_var.replace('_', ' ').title()}")
-                    return False
-            
-            # Validate hotkeys if enabled
-            if self.vars['enable_hotkeys'].get():
-                from .hotkey_handler import HotkeyHandler
-                hotkey_handler = HotkeyHandler(self.settings_manager)
-                
-                hotkey_on = self.vars['hotkey_webcam_on'].get().strip()
-                hotkey_off = self.vars['hotkey_webcam_off'].get().strip()
-                
-                if hotkey_on and not hotkey_handler.is_hotkey_valid(hotkey_on):
-                    messagebox.showerror("Validation Error", f"Invalid hotkey format for webcam ON: {hotkey_on}")
-                    return False
-                
-                if hotkey_off and not hotkey_handler.is_hotkey_valid(hotkey_off):
-                    messagebox.showerror("Validation Error", f"Invalid hotkey format for webcam OFF: {hotkey_off}")
-                    return False
-                
-                if hotkey_on and hotkey_off and hotkey_on == hotkey_off:
-                    messagebox.showerror("Validation Error", "Webcam ON and OFF hotkeys cannot be the same")
-                    return False
-            
-            return True
-            
-        except ValueError as e:
-            messagebox.showerror("Validation Error", f"Invalid numeric value: {e}")
-            return False
+        Returns:
+            bool: True if valid
+        """
+        return _HOTKEY_RE.fullmatch(hotkey) is not None and HotkeyHandler.is_hotkey_valid(hotkey)
     
     def _save_settings(self):
         """Save settings and close dialog."""
@@ -385,31 +567,36 @@ class SettingsDialog:
         
         try:
             # Update settings
-            password = self.vars['obs_password'].get().strip()
-            self.settings_manager.update_settings(
-                obs_host=self.vars['obs_host'].get().strip(),
-                obs_port=int(self.vars['obs_port'].get()),
+            password = self._get_value('obs_password').strip()
+            updated = self.settings_manager.update_settings(
+                obs_host=self._get_value('obs_host').strip(),
+                obs_port=int(self._get_value('obs_port')),
                 obs_password=password if password else None,
-                scene_name=self.vars['scene_name'].get().strip(),
-                source_name=self.vars['source_name'].get().strip(),
-                reconnect_delay=float(self.vars['reconnect_delay'].get()),
-                auto_connect=self.vars['auto_connect'].get(),
-                start_minimized=self.vars['start_minimized'].get(),
-                camera_on_color=self.vars['camera_on_color'].get().strip(),
-                camera_off_color=self.vars['camera_off_color'].get().strip(),
-                enable_hotkeys=self.vars['enable_hotkeys'].get(),
-                hotkey_webcam_on=self.vars['hotkey_webcam_on'].get().strip(),
-                hotkey_webcam_off=self.vars['hotkey_webcam_off'].get().strip()
+                scene_name=self._get_value('scene_name').strip(),
+                source_name=self._get_value('source_name').strip(),
+                reconnect_delay=float(self._get_value('reconnect_delay')),
+                connect_timeout=float(self._get_value('connect_timeout')),
+                auto_connect=self._get_value('auto_connect'),
+                start_minimized=self._get_value('start_minimized'),
+                camera_on_color=self._get_value('camera_on_color').strip(),
+                camera_off_color=self._get_value('camera_off_color').strip(),
+                enable_hotkeys=self._get_value('enable_hotkeys'),
+                hotkey_webcam_on=self._get_value('hotkey_webcam_on').strip(),
+                hotkey_webcam_off=self._get_value('hotkey_webcam_off').strip()
             )
             
+            # Write now rather than after the save delay, so write errors are reported here
+            if not (updated and self.settings_manager.flush()):
+                messagebox.showerror("Error", "Failed to save settings. See the log for details.")
+                return
+            
             self.result = True
-            messagebox.showinfo("Success", "Settings saved successfully!")
             
             # Notify callback
             if self.on_settings_changed:
                 self.on_settings_changed()
             
-            self.root.destroy()
+            self._close()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {e}")
@@ -417,7 +604,30 @@ class SettingsDialog:
     def _cancel(self):
         """Cancel and close dialog."""
         self.result = False
-        self.root.destroy()
+        self._close()
+    
+    def _close(self):
+        """Hide the dialog, ending show(), and keep it for the next show."""
+        # Results of background operations still running are ignored once hidden
+        self._cancel_polls()
+        self.root.withdraw()
+        self._closed.set(True)
+    
+    def _cancel_polls(self):
+        """Stop checking for the results of pending background operations."""
+        for after_id in self._pending_polls.values():
+            self.root.after_cancel(after_id)
+        self._pending_polls.clear()
+    
+    def _on_destroy(self, event):
+        """Shut down the IO worker when the dialog window is destroyed."""
+        # Child widgets' Destroy events propagate to the toplevel binding too
+        if event.widget is not self.root:
+            return
+        self._pending_polls.clear()
+        if self._io_pool:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
     
     def _reset_defaults(self):
         """Reset all settings to defaults."""
@@ -425,28 +635,48 @@ class SettingsDialog:
             try:
                 self.settings_manager.reset_to_defaults()
                 self._populate_fields()  # Refresh form with defaults
-                messagebox.showinfo("Success", "Settings reset to defaults!")
+                self._status_label.configure(text="Settings reset to defaults")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to reset settings: {e}")
     
+    def _run_in_background(self, func: Callable, *args, on_done: Callable[[Future], None]):
+        """
+        Run a blocking call on the IO worker and handle its result on the Tk thread.
+        
+        Args:
+            func: Function to run
+            *args: Arguments for func
+            on_done: Called with the finished future from the Tk event loop
+        """
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=1)
+        
+        future = self._io_pool.submit(func, *args)
+        self._pending_polls[future] = self.root.after(50, self._poll_future, future, on_done)
+    
+    def _poll_future(self, future: Future, on_done: Callable[[Future], None]):
+        """Call on_done once the future has finished, checking again later if not."""
+        if future.done():
+            self._pending_polls.pop(future, None)
+            on_done(future)
+        else:
+            self._pending_polls[future] = self.root.after(50, self._poll_future, future, on_done)
+    
     def _open_settings_folder(self):
         """Open the settings folder in file explorer."""
         try:
-            import subprocess
-            import platform
-            
             folder_path = self.settings_manager.config_dir
+            cmd = [_OPEN_FOLDER_CMD, str(folder_path)]
             
-            if platform.system() == "Windows":
-                subprocess.Popen(['explorer', str(folder_path)])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.Popen(['open', str(folder_path)])
-            else:  # Linux
-                subprocess.Popen(['xdg-open', str(folder_path)])
-                
+            self._run_in_background(subprocess.Popen, cmd, on_done=self._on_folder_opened)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open settings folder: {e}")
     
+    def _on_folder_opened(self, future: Future):
+        """Report a failure to launch the file explorer."""
+        if future.exception():
+            messagebox.showerror("Error", f"Failed to open settings folder: {future.exception()}")
+    
     def _export_settings(self):
         """Export settings to a file."""
         try:
@@ -456,13 +686,20 @@ class SettingsDialog:
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
             )
             if filename:
-                if self.settings_manager.export_settings(Path(filename)):
-                    messagebox.showinfo("Success", f"Settings exported to {filename}")
-                else:
-                    messagebox.showerror("Error", "Failed to export settings")
+                self._run_in_background(self.settings_manager.export_settings, Path(filename),
+                                        on_done=lambda future: self._on_exported(future, filename))
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {e}")
     
+    def _on_exported(self, future: Future, filename: str):
+        """Report the result of a settings export."""
+        if future.exception():
+            messagebox.showerror("Error", f"Export failed: {future.exception()}")
+        elif future.result():
+            self._status_label.configure(text=f"Settings exported to {filename}")
+        else:
+            messagebox.showerror("Error", "Failed to export settings")
+    
     def _import_settings(self):
         """Import settings from a file."""
         try:
@@ -472,14 +709,21 @@ class SettingsDialog:
             )
             if filename:
                 if messagebox.askyesno("Import Settings", "This will overwrite current settings. Continue?"):
-                    if self.settings_manager.import_settings(Path(filename)):
-                        self._populate_fields()  # Refresh form with imported settings
-                        messagebox.showinfo("Success", f"Settings imported from {filename}")
-                    else:
-                        messagebox.showerror("Error", "Failed to import settings")
+                    self._run_in_background(self.settings_manager.import_settings, Path(filename),
+                                            on_done=lambda future: self._on_imported(future, filename))
         except Exception as e:
             messagebox.showerror("Error", f"Import failed: {e}")
     
+    def _on_imported(self, future: Future, filename: str):
+        """Refresh the form after a settings import, or report its failure."""
+        if future.exception():
+            messagebox.showerror("Error", f"Import failed: {future.exception()}")
+        elif future.result():
+            self._populate_fields()  # Refresh form with imported settings
+            self._status_label.configure(text=f"Settings imported from {filename}")
+        else:
+            messagebox.showerror("Error", "Failed to import settings")
+    
     def _record_hotkey(self, var_name: str):
         """Record a hotkey by capturing user input."""
         try:
@@ -490,106 +734,119 @@ class SettingsDialog:
     
     def _show_hotkey_recording_dialog(self, var_name: str):
         """Show dialog to record a hotkey."""
-        # Create recording dialog
+        # The recording window is created on first use and reused afterwards
+        if self._record_window is None:
+            self._create_recording_window()
+        
+        self._record_target = var_name
+        self._recorded_hotkey = ""
+        
+        instruction_text = f"Recording hotkey for: {self._DISPLAY_NAMES[var_name]}"
+        self._record_instruction.configure(text=instruction_text)
+        self._record_keys_var.set("Waiting for input...")
+        
+        self._record_window.deiconify()
+        self._record_window.grab_set()
+        self._record_window.focus_set()
+    
+    def _create_recording_window(self):
+        """Create the hidden hotkey recording window."""
         recording_window = tk.Toplevel(self.root)
+        recording_window.withdraw()
         recording_window.title("Record Hotkey")
-        recording_window.geometry("400x200")
         recording_window.transient(self.root)
-        recording_window.grab_set()
         
         # Center the recording window
-        recording_window.update_idletasks()
         x = (recording_window.winfo_screenwidth() // 2) - 200
         y = (recording_window.winfo_screenheight() // 2) - 100
         recording_window.geometry(f"400x200+{x}+{y}")
         
         # Instructions
-        instruction_text = f"Recording hotkey for: {var_name.replace('hotkey_', '').replace('_', ' ').title()}"
-        ttk.Label(recording_window, text=instruction_text, font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
+        self._record_instruction = ttk.Label(recording_window, font=('TkDefaultFont', 10, 'bold'))
+        self._record_instruction.pack(pady=10)
         ttk.Label(recording_window, text="Press the desired key combination:", font=('TkDefaultFont', 9)).pack(pady=5)
         
         # Current keys display
-        keys_var = tk.StringVar()
-        keys_var.set("Waiting for input...")
-        keys_label = ttk.Label(recording_window, textvariable=keys_var, font=('TkDefaultFont', 12, 'bold'), foreground='blue')
+        self._record_keys_var = tk.StringVar(recording_window)
+        keys_label = ttk.Label(recording_window, textvariable=self._record_keys_var, font=('TkDefaultFont', 12, 'bold'), foreground='blue')
         keys_label.pack(pady=10)
         
         # Buttons
         button_frame = ttk.Frame(recording_window)
         button_frame.pack(pady=20)
         
-        recorded_hotkey = ""
-        
-        def on_key_press(event):
-            nonlocal recorded_hotkey
-            
-            # Build hotkey string
-            modifiers = []
-            if event.state & 0x4:  # Control
-                modifiers.append("<ctrl>")
-            if event.state & 0x8:  # Alt
-                modifiers.append("<alt>")
-            if event.state & 0x1:  # Shift
-                modifiers.append("<shift>")
-            if event.state & 0x40000:  # Windows key (varies by system)
-                modifiers.append("<win>")
-            
-            # Get the key
-            key = event.keysym.lower()
-            
-            # Special key mappings
-            key_mappings = {
-                'control_l': 'ctrl', 'control_r': 'ctrl',
-                'alt_l': 'alt', 'alt_r': 'alt',
-                'shift_l': 'shift', 'shift_r': 'shift',
-                'super_l': 'win', 'super_r': 'win',
-                'return': 'enter', 'backspace': 'backspace',
-                'delete': 'delete', 'escape': 'escape',
-                'tab': 'tab', 'space': 'space'
-            }
-            
-            if key in key_mappings:
-                key = key_mappings[key]
-            elif key.startswith('f') and key[1:].isdigit():
-                # Function keys
-                pass
-            elif len(key) == 1 and (key.isalnum()):
-                # Regular alphanumeric keys
-                pass
-            elif key in ['up', 'down', 'left', 'right', 'home', 'end', 'pageup', 'pagedown', 'insert']:
-                # Arrow and navigation keys
-                pass
-            else:
-                # Skip modifier-only presses
-                if key in ['ctrl', 'alt', 'shift', 'win']:
-                    return
-            
-            # Only proceed if we have modifiers and a non-modifier key
-            if modifiers and key not in ['ctrl', 'alt', 'shift', 'win']:
-                if len(key) == 1:
-                    recorded_hotkey = "+".join(modifiers + [key])
-                else:
-                    recorded_hotkey = "+".join(modifiers + [f"<{key}>"])
-                keys_var.set(recorded_hotkey)
-        
-        def save_hotkey():
-            if recorded_hotkey:
-                self.vars[var_name].set(recorded_hotkey)
-                recording_window.destroy()
-            else:
-                messagebox.showwarning("No Hotkey", "Please press a key combination first")
-        
-        def cancel_recording():
-            recording_window.destroy()
-        
         # Bind key events
-        recording_window.bind('<KeyPress>', on_key_press)
-        recording_window.focus_set()
+        recording_window.bind('<KeyPress>', self._on_record_key_press)
+        recording_window.protocol('WM_DELETE_WINDOW', self._hide_recording_window)
         
         # Buttons
-        ttk.Button(button_frame, text="Save", command=save_hotkey).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Clear", command=lambda: self.vars[var_name].set("")).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=cancel_recording).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Save", command=self._save_recorded_hotkey).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear", command=lambda: self._set_value(self._record_target, "")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self._hide_recording_window).pack(side=tk.LEFT, padx=5)
         
         # Instructions at bottom
-        ttk.Label(recording_window, text="Note: Use Ctrl, Alt, Shift with other keys", font=('TkDefaultFont', 8), foreground='gray').pack(pady=(10, 0)) 
\ No newline at end of file
+        ttk.Label(recording_window, text="Note: Use Ctrl, Alt, Shift with other keys", style='Help.TLabel').pack(pady=(10, 0))
+        
+        self._record_window = recording_window
+    
+    def _on_record_key_press(self, event):
+        """Build a hotkey string from a key press in the recording window."""
+        # Build hotkey string
+        modifiers = self._modifiers_for_state(event.state)
+        
+        # Get the key
+        key = event.keysym.lower()
+        
+        if key in _KEY_MAPPINGS:
+            key = _KEY_MAPPINGS[key]
+        elif key.startswith('f') and key[1:].isdigit():
+            # Function keys
+            pass
+        elif len(key) == 1 and (key.isalnum()):
+            # Regular alphanumeric keys
+            pass
+        elif key in _NAV_KEYS:
+            # Arrow and navigation keys
+            pass
+        else:
+            # Skip modifier-only presses
+            if key in ['ctrl', 'alt', 'shift', 'win']:
+                return
+        
+        # Only proceed if we have modifiers and a non-modifier key
+        if modifiers and key not in ['ctrl', 'alt', 'shift', 'win']:
+            if len(key) == 1:
+                self._recorded_hotkey = "+".join((*modifiers, key))
+            else:
+                self._recorded_hotkey = "+".join((*modifiers, f"<{key}>"))
+            self._record_keys_var.set(self._recorded_hotkey)
+    
+    @staticmethod
+    def _modifiers_for_state(state: int) -> Tuple[str, ...]:
+        """
+        Get the hotkey modifier names for a Tk event state.
+        
+        Args:
+            state: Tk event state bitmask
+            
+        Returns:
+            Tuple[str, ...]: Modifier names in hotkey order
+        """
+        state &= _MOD_MASK
+        modifiers = _MOD_CACHE.get(state)
+        if modifiers is None:
+            modifiers = _MOD_CACHE[state] = tuple(tag for bit, tag in _MOD_BITS if state & bit)
+        return modifiers
+    
+    def _save_recorded_hotkey(self):
+        """Store the recorded hotkey in its form field and hide the recording window."""
+        if self._recorded_hotkey:
+            self._set_value(self._record_target, self._recorded_hotkey)
+            self._hide_recording_window()
+        else:
+            messagebox.showwarning("No Hotkey", "Please press a key combination first")
+    
+    def _hide_recording_window(self):
+        """Hide the recording window so it can be shown again."""
+        self._record_window.grab_release()
+        self._record_window.withdraw()
@@ -3,14 +3,80 @@ Settings manager for OBS VirtualCam Tray Controller.
 Handles persistent storage and configuration management.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import os
+import shutil
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Callable, List
+from dataclasses import dataclass, fields
 
+# orjson is optional; the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@functools.lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """Get the platform-appropriate config directory, decided once per process."""
+    if sys.platform == "win32":
+        appdata = os.environ.get("APPDATA")
+        base = Path(appdata) if appdata else Path.home() / "AppData" / "Roaming"
+        return base / "OBSTrayController"
+    if sys.platform == "darwin":
+        return Path.home() / ".obs-tray-controller"
+    config_home = os.environ.get("XDG_CONFIG_HOME")
+    base = Path(config_home) if config_home else Path.home() / ".config"
+    return base / "obs-tray-controller"
+
+
+def _legacy_config_dirs() -> List[Path]:
+    """
+    Get the config directories earlier versions picked by probing the home directory.
+    
+    Returns:
+        Directories in the order earlier versions checked them
+    """
+    home = Path.home()
+    return [
+        home / "AppData" / "Roaming" / "OBSTrayController",
+        home / ".config" / "obs-tray-controller",
+        home / ".obs-tray-controller",
+    ]
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON document from a file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _encode_json(data: Any) -> bytes:
+    """Encode data as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Encode in one go; json.dump() would issue many small writes
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _write_json(path: Path, data: Any):
+    """Write data to a file as indented JSON."""
+    path.write_bytes(_encode_json(data))
+
+
+# Slotted dataclasses need Python 3.10; older versions keep a per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Settings:
     """Application settings dataclass."""
     # OBS WebSocket Configuration
@@ -24,6 +90,7 @@ class Settings:
     
     # Application Configuration
     reconnect_delay: float = 3.0
+    connect_timeout: float = 5.0
     auto_connect: bool = False
     start_minimized: bool = True
     
@@ -38,20 +105,27 @@ class Settings:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary."""
-        return asdict(self)
+        # Fields are flat values, so asdict()'s recursive deep copy is not needed
+        return {name: getattr(self, name) for name in Settings._FIELD_NAMES}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Settings':
         """Create settings from dictionary."""
         # Filter out unknown keys to handle version compatibility
-        known_fields = {field.name for field in cls.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered_data)
+        return cls(**{k: v for k, v in data.items() if k in cls._KNOWN_FIELDS})
+
+
+# Setting names in declaration order, and as a set for filtering settings data from files
+Settings._FIELD_NAMES = tuple(f.name for f in fields(Settings))
+Settings._KNOWN_FIELDS = frozenset(Settings._FIELD_NAMES)
 
 
 class SettingsManager:
     """Manages application settings with persistent storage."""
     
+    # Seconds without further updates before changed settings are written
+    SAVE_DELAY = 0.25
+    
     def __init__(self, config_dir: Optional[Path] = None):
         """
         Initialize settings manager.
@@ -61,60 +135,155 @@ class SettingsManager:
         """
         self.logger = logging.getLogger(__name__)
         
+        # Callbacks notified with the current settings whenever they change
+        self._change_callbacks: List[Callable[[Settings], None]] = []
+        
+        # Pending debounced save; the lock also keeps writes from overlapping.
+        # Callers own flush(): it writes anything pending and reports failures.
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        
+        # True while settings changes have not been written successfully
+        self._dirty = False
+        
+        # Hash of the settings file contents last written by this manager
+        self._saved_digest: Optional[bytes] = None
+        
         # Determine config directory
         if config_dir:
             self.config_dir = config_dir
         else:
             # Use platform-appropriate config directory
-            home = Path.home()
-            if Path.home().joinpath("AppData").exists():  # Windows
-                self.config_dir = home / "AppData" / "Roaming" / "OBSTrayController"
-            elif Path.home().joinpath(".config").exists():  # Linux
-                self.config_dir = home / ".config" / "obs-tray-controller"
-            else:  # macOS or fallback
-                self.config_dir = home / ".obs-tray-controller"
+            self.config_dir = _default_config_dir()
         
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "settings.json"
         
+        # Carry over settings saved where earlier versions kept them
+        if not config_dir:
+            self._migrate_legacy_settings()
+        
         # Load or create default settings
         self._settings = self._load_settings()
     
+    def _migrate_legacy_settings(self):
+        """Copy a settings file from a legacy config directory if there is none here yet."""
+        if self.config_file.exists():
+            return
+        
+        for legacy_dir in _legacy_config_dirs():
+            legacy_file = legacy_dir / "settings.json"
+            if legacy_file == self.config_file or not legacy_file.is_file():
+                continue
+            try:
+                shutil.copy2(legacy_file, self.config_file)
+                self.logger.info("Migrated settings from %s", legacy_file)
+            except OSError as e:
+                self.logger.warning("Could not migrate settings from %s: %s", legacy_file, e)
+            return
+    
     def _load_settings(self) -> Settings:
         """Load settings from file or create defaults."""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    settings = Settings.from_dict(data)
-                    self.logger.info(f"Loaded settings from {self.config_file}")
-                    return settings
+                data = _read_json(self.config_file)
+                settings = Settings.from_dict(data)
+                self.logger.info("Loaded settings from %s", self.config_file)
+                return settings
             else:
                 self.logger.info("No settings file found, using defaults")
                 return Settings()
                 
         except Exception as e:
-            self.logger.error(f"Error loading settings: {e}, using defaults")
+            self.logger.error("Error loading settings: %s, using defaults", e)
             return Settings()
     
     def _save_settings(self) -> bool:
         """Save current settings to file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._settings.to_dict(), f, indent=2)
-            self.logger.info(f"Settings saved to {self.config_file}")
+            payload = _encode_json(self._settings.to_dict())
+            
+            # Skip the write if the file already holds exactly these settings
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._saved_digest:
+                return True
+            
+            # Write a temporary file and swap it in, so a crash can't leave a truncated file
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.config_file)
+            
+            self._saved_digest = digest
+            self.logger.info("Settings saved to %s", self.config_file)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error saving settings: {e}")
+            self.logger.error("Error saving settings: %s", e)
             return False
     
+    def _schedule_save(self) -> bool:
+        """
+        Save settings once updates have been quiet for SAVE_DELAY seconds.
+        
+        Returns:
+            bool: True once the save is scheduled; flush() reports whether it was written
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+        return True
+    
+    def _save_now(self) -> bool:
+        """Cancel any pending save and save settings immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            saved = self._save_settings()
+            self._dirty = not saved
+            return saved
+    
+    def flush(self) -> bool:
+        """
+        Write changed settings to disk now, retrying a debounced save that failed.
+        
+        Returns:
+            bool: True if nothing was pending or the save succeeded
+        """
+        if not self._dirty:
+            return True
+        return self._save_now()
+    
     @property
     def settings(self) -> Settings:
         """Get current settings."""
         return self._settings
     
+    def add_change_callback(self, callback: Callable[[Settings], None]):
+        """
+        Register a callback for settings changes.
+        
+        The callback receives the current settings object, which is replaced
+        (not mutated) by reset_to_defaults() and import_settings().
+        
+        Args:
+            callback: Function called with the current settings after each change
+        """
+        self._change_callbacks.append(callback)
+    
+    def _notify_change(self):
+        """Notify registered callbacks that settings changed."""
+        for callback in self._change_callbacks:
+            try:
+                callback(self._settings)
+            except Exception as e:
+                self.logger.error("Error in settings change callback: %s", e)
+    
     def update_setting(self, key: str, value: Any) -> bool:
         """
         Update a single setting.
@@ -124,18 +293,22 @@ class SettingsManager:
             value: New value
             
         Returns:
-            bool: True if successful
+            bool: True if the setting was updated; the file is written shortly
+            after, and flush() reports whether that succeeded
         """
         try:
-            if hasattr(self._settings, key):
+            if key in Settings._KNOWN_FIELDS:
+                if getattr(self._settings, key) == value:
+                    return True  # Nothing to save or notify
                 setattr(self._settings, key, value)
-                return self._save_settings()
+                self._notify_change()
+                return self._schedule_save()
             else:
-                self.logger.error(f"Unknown setting key: {key}")
+                self.logger.error("Unknown setting key: %s", key)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error updating setting {key}: {e}")
+            self.logger.error("Error updating setting %s: %s", key, e)
             return False
     
     def update_settings(self, **kwargs) -> bool:
@@ -146,55 +319,64 @@ class SettingsManager:
             **kwargs: Settings to update
             
         Returns:
-            bool: True if successful
+            bool: True if the settings were updated; the file is written shortly
+            after, and flush() reports whether that succeeded
         """
         try:
+            changed = False
             for key, value in kwargs.items():
-                if hasattr(self._settings, key):
-                    setattr(self._settings, key, value)
+                if key in Settings._KNOWN_FIELDS:
+                    if getattr(self._settings, key) != value:
+                        setattr(self._settings, key, value)
+                        changed = True
                 else:
-                    self.logger.warning(f"Ignoring unknown setting: {key}")
+                    self.logger.warning("Ignoring unknown setting: %s", key)
+            
+            # The settings dialog submits the whole form, often unchanged
+            if not changed:
+                return True
             
-            return self._save_settings()
+            self._notify_change()
+            return self._schedule_save()
             
         except Exception as e:
-            self.logger.error(f"Error updating settings: {e}")
+            self.logger.error("Error updating settings: %s", e)
             return False
     
     def reset_to_defaults(self) -> bool:
         """Reset all settings to defaults."""
         try:
             self._settings = Settings()
-            return self._save_settings()
+            self._notify_change()
+            return self._save_now()
             
         except Exception as e:
-            self.logger.error(f"Error resetting settings: {e}")
+            self.logger.error("Error resetting settings: %s", e)
             return False
     
     def export_settings(self, file_path: Path) -> bool:
         """Export settings to a file."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings.to_dict(), f, indent=2)
-            self.logger.info(f"Settings exported to {file_path}")
+            _write_json(file_path, self._settings.to_dict())
+            self.logger.info("Settings exported to %s", file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error exporting settings: {e}")
+            self.logger.error("Error exporting settings: %s", e)
             return False
     
     def import_settings(self, file_path: Path) -> bool:
         """Import settings from a file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._settings = Settings.from_dict(data)
+            data = _read_json(file_path)
+            self._settings = Settings.from_dict(data)
+            self._notify_change()
             
-            success = self._save_settings()
+            success = self._save_now()
             if success:
-                self.logger.info(f"Settings imported from {file_path}")
+                self.logger.info("Settings imported from %s", file_path)
             return success
             
         except Exception as e:
-            self.logger.error(f"Error importing settings: {e}")
+            self.logger.error("Error importing settings: %s", e)
             return False 
\ No newline at end of file
@@ -3,22 +3,76 @@ System tray handler module.
 Manages the system tray icon, menu, and user interactions.
 """
 
+import base64
+import functools
 import logging
 import threading
-import webbrowser
-from typing import Optional, Callable
-from PIL import Image, ImageDraw
+import zlib
+from pathlib import Path
+from typing import Optional, Callable, TYPE_CHECKING
+from PIL import Image
 import pystray
 
 from .obs_client import OBSClient
 from .settings_manager import SettingsManager
-from .settings_dialog import SettingsDialog
 from .hotkey_handler import HotkeyHandler
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    
+    from .settings_dialog import SettingsDialog
+
+
+# Fallback icons as zlib-compressed, base64-encoded 32x32 RGBA pixels: a colored
+# circle (gray/red/green) with a white X (disconnected), dash (off) or check (on)
+_DEFAULT_ICON_PIXELS = {
+    'disconnected': (
+        'eNrtlt0OgCAIhX183trWRVsS8pMo1DybVzG/o2BQytaWWZVZUdyZPpq9AaC7JvhQcQUfS9lOHobYDh4e7FMa'
+        'Jo57wSfZlyQ2FWf0QN675IH7buCzOe8xNPej9CDWHGZpc+PFx0wN25tvOfffzh+Z/wX1H/3+M/z/Gg/WOsfx'
+        'I/3n7sHS9wh2/Vj/zzD/ZJj/Msy/Web/LWcdTMx2jw=='
+    ),
+    'off': (
+        'eNrtllsKACAIBL3/pe07iMpHuoYL/TYDkS5RpyMOb04W96XHdDdvzgOPK+7BI5Tt5GBiOziY2QuHcLbSIZPv'
+        'zhY6YPI1af4/71/8DxaaPwjzH2H/Ze9/hP6D0P8Q+i9K/+84ZwDJNpCa'
+    ),
+    'on': (
+        'eNrt1sEOgDAIA9D9/09rPJho5hBoGRyo8bpXY8IYo9Mx5xDeLDeyx/ts6eH30Llyj702pwNm4x1we+6w3/Z1'
+        'gPwrgA/bd5wd3L5oB/u/NsFfna2yQX9lqG3S9z8tk036/18JmAHqDlnzx2Rnz2Dk/sm7/7Lv/wr7T4X9r8L+'
+        'W2X/75BzAvEPiKI='
+    ),
+}
+
+
+# Tray icon size in pixels; matches the fallback icons
+_ICON_SIZE = (32, 32)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_png(path: str, mtime_ns: int) -> Image.Image:
+    """
+    Load an icon file as a decoded 32x32 RGBA image.
+    
+    Cached by path and modification time, so an unchanged file is read only once.
+    
+    Args:
+        path: Icon file path
+        mtime_ns: File modification time, part of the cache key
+        
+    Returns:
+        PIL Image for the icon
+    """
+    # Decode and scale once here rather than on pystray's thread at every icon change;
+    # the resized copy holds no reference to the file
+    with Image.open(path) as img:
+        return img.convert('RGBA').resize(_ICON_SIZE, Image.LANCZOS)
+
 
 class TrayHandler:
     """Handles system tray icon and user interactions."""
     
+    # Seconds to wait for further state changes before redrawing the tray icon and menu
+    REFRESH_DELAY = 0.05
+    
     def __init__(self, obs_client: OBSClient, settings_manager: SettingsManager):
         """
         Initialize tray handler.
@@ -30,7 +84,11 @@ class TrayHandler:
         self.obs_client = obs_client
         self.settings_manager = settings_manager
         self.icon: Optional[pystray.Icon] = None
-        self.settings_dialog: Optional[SettingsDialog] = None
+        self.settings_dialog: Optional["SettingsDialog"] = None
+        
+        # Hidden Tk root shared by all dialogs, created on first use
+        self._tk_root: Optional["tk.Tk"] = None
+        self._tk_root_thread: Optional[int] = None
         
         # Initialize hotkey handler
         self.hotkey_handler = HotkeyHandler(settings_manager)
@@ -46,6 +104,16 @@ class TrayHandler:
         self.current_connection_state = False
         self.current_webcam_state = None  # None = unknown, True = on, False = off
         
+        # Coalesced icon/menu refresh, drawn by one long-lived worker thread
+        self._refresh_lock = threading.Lock()
+        self._refresh_requested = threading.Event()
+        self._refresh_stopped = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        
+        # Set by stop(); guarded so a stop during startup keeps start() from running the icon
+        self._icon_lock = threading.Lock()
+        self._stopped = False
+        
         # Load static icons from assets
         self._load_icons()
         
@@ -61,130 +129,103 @@ class TrayHandler:
         Load static icon files from assets directory.
         Falls back to creating dynamic icons if files are not found.
         """
-        import os
-        from pathlib import Path
-        
         # Get the directory where the script is located
         base_dir = Path(__file__).parent.parent
         assets_dir = base_dir / 'assets'
         
         try:
-            # Load disconnected icon
-            disconnected_path = assets_dir / 'OBS-WebCam-Tray-Logo_Disconnected.png'
-            if disconnected_path.exists():
-                self.disconnected_icon = Image.open(disconnected_path)
-                self.logger.info(f"Loaded disconnected icon from {disconnected_path}")
-            else:
-                self.logger.warning(f"Disconnected icon not found at {disconnected_path}, creating default")
-                self.disconnected_icon = self._create_default_icon('disconnected')
-            
-            # Load camera off icon
-            camera_off_path = assets_dir / 'OBS-WebCam-Tray-Logo_Webcam_Turned_Off.png'
-            if camera_off_path.exists():
-                self.camera_off_icon = Image.open(camera_off_path)
-                self.logger.info(f"Loaded camera off icon from {camera_off_path}")
-            else:
-                self.logger.warning(f"Camera off icon not found at {camera_off_path}, creating default")
-                self.camera_off_icon = self._create_default_icon('off')
-            
-            # Load camera on icon
-            camera_on_path = assets_dir / 'OBS-WebCam-Tray-Logo_Webcam_Turned_On.png'
-            if camera_on_path.exists():
-                self.camera_on_icon = Image.open(camera_on_path)
-                self.logger.info(f"Loaded camera on icon from {camera_on_path}")
-            else:
-                self.logger.warning(f"Camera on icon not found at {camera_on_path}, creating default")
-                self.camera_on_icon = self._create_default_icon('on')
+            self.disconnected_icon = self._load_icon(
+                assets_dir / 'OBS-WebCam-Tray-Logo_Disconnected.png', 'disconnected', "disconnected")
+            self.camera_off_icon = self._load_icon(
+                assets_dir / 'OBS-WebCam-Tray-Logo_Webcam_Turned_Off.png', 'off', "camera off")
+            self.camera_on_icon = self._load_icon(
+                assets_dir / 'OBS-WebCam-Tray-Logo_Webcam_Turned_On.png', 'on', "camera on")
                 
         except Exception as e:
-            self.logger.error(f"Error loading icons: {e}")
+            self.logger.error("Error loading icons: %s", e)
             # Fall back to creating default icons
             self.disconnected_icon = self._create_default_icon('disconnected')
             self.camera_off_icon = self._create_default_icon('off')
             self.camera_on_icon = self._create_default_icon('on')
     
-    def _create_default_icon(self, state: str) -> Image.Image:
+    def _load_icon(self, path: Path, state: str, name: str) -> Image.Image:
+        """
+        Load one icon file, or create the default icon if it is missing.
+        
+        Args:
+            path: Icon file path
+            state: 'on', 'off', or 'disconnected', for the default icon
+            name: Icon name for log messages
+            
+        Returns:
+            PIL Image for the icon
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.logger.warning("%s icon not found at %s, creating default", name.capitalize(), path)
+            return self._create_default_icon(state)
+        
+        icon = _load_png(str(path), mtime_ns)
+        self.logger.info("Loaded %s icon from %s", name, path)
+        return icon
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=3)
+    def _create_default_icon(state: str) -> Image.Image:
         """
         Create a simple default icon as fallback.
         
+        Icons are cached per state, so callers must not modify the returned image.
+        
         Args:
             state: 'on', 'off', or 'disconnected'
             
         Returns:
             PIL Image for the icon
         """
-        img = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Simple circle with different colors for different states
-        if state == 'on':
-            color = '#00FF00'  # Green
-        elif state == 'off':
-            color = '#FF0000'  # Red
-        else:  # disconnected
-            color = '#888888'  # Gray
-        
-        # Draw a simple circle
-        draw.ellipse([4, 4, 28, 28], fill=color, outline='black', width=2)
-        
-        # Add a simple indicator
-        if state == 'disconnected':
-            # Draw X for disconnected
-            draw.line([10, 10, 22, 22], fill='white', width=2)
-            draw.line([10, 22, 22, 10], fill='white', width=2)
-        elif state == 'on':
-            # Draw checkmark for on
-            draw.line([10, 16, 14, 20], fill='white', width=2)
-            draw.line([14, 20, 22, 12], fill='white', width=2)
-        else:  # off
-            # Draw dash for off
-            draw.line([10, 16, 22, 16], fill='white', width=3)
-        
-        return img
+        pixels = zlib.decompress(base64.b64decode(_DEFAULT_ICON_PIXELS[state]))
+        return Image.frombytes('RGBA', _ICON_SIZE, pixels)
     
     # Connection menu actions
     def _on_connect(self, icon, item):
         """Handle connect to OBS action."""
         self.logger.info("User requested connection to OBS")
         if self.obs_client.connect():
-            self.current_connection_state = True
-            self._update_icon()
-            self._update_menus()
+            self._set_connection_state(True)
         else:
             self.logger.error("Failed to connect to OBS")
     
+    def _on_toggle_connection(self, icon, item):
+        """Handle the connect/disconnect menu item."""
+        if self.current_connection_state:
+            self._on_disconnect(icon, item)
+        else:
+            self._on_connect(icon, item)
+    
     def _on_disconnect(self, icon, item):
         """Handle disconnect from OBS action."""
         self.logger.info("User requested disconnection from OBS")
         self.obs_client.disconnect()
-        self.current_connection_state = False
-        self.current_webcam_state = None
-        self._update_icon()
-        self._update_menus()
+        self._set_connection_state(False)
     
     # Webcam control actions
     def _on_webcam_on(self, icon, item):
         """Handle turn webcam on action."""
         self.logger.info("User requested to turn webcam ON")
         if self.obs_client.set_source_visibility(True) is not None:
-            self.current_webcam_state = True
-            self._update_icon()
-            self._update_menus()
+            self._set_webcam_state(True)
     
     def _on_webcam_off(self, icon, item):
         """Handle turn webcam off action."""
         self.logger.info("User requested to turn webcam OFF")
         if self.obs_client.set_source_visibility(False) is not None:
-            self.current_webcam_state = False
-            self._update_icon()
-            self._update_menus()
+            self._set_webcam_state(False)
     
     def _refresh_webcam_state(self, icon, item):
         """Refresh webcam state from OBS."""
         if self.current_connection_state:
-            self.current_webcam_state = self.obs_client.is_source_visible()
-            self._update_icon()
-            self._update_menus()
+            self._set_webcam_state(self.obs_client.is_source_visible())
             
     # Settings menu actions
     def _on_settings(self, icon, item):
@@ -192,28 +233,29 @@ class TrayHandler:
         self.logger.info("Settings dialog requested")
         
         try:
-            # Create and show settings dialog
-            dialog = SettingsDialog(
-                settings_manager=self.settings_manager,
-                on_settings_changed=self._on_settings_changed
-            )
+            # Create the settings dialog once and reuse its window on later opens
+            if self.settings_dialog is None:
+                # Imported on first use; it pulls in tkinter
+                from .settings_dialog import SettingsDialog
+                
+                self.settings_dialog = SettingsDialog(
+                    settings_manager=self.settings_manager,
+                    on_settings_changed=self._on_settings_changed,
+                    parent=self._get_tk_root()
+                )
             
             # Show dialog (this will block until closed)
-            if dialog.show():
+            if self.settings_dialog.show():
                 self.logger.info("Settings were updated by user")
             else:
                 self.logger.info("Settings dialog was cancelled")
                 
         except Exception as e:
-            self.logger.error(f"Error showing settings dialog: {e}")
+            self.logger.error("Error showing settings dialog: %s", e)
             # Fallback to simple message
-            import tkinter as tk
             from tkinter import messagebox
             
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Error", f"Failed to open settings dialog: {e}")
-            root.destroy()
+            messagebox.showerror("Error", f"Failed to open settings dialog: {e}", parent=self._get_tk_root())
     
     def _on_settings_changed(self):
         """Called when settings are changed via the dialog."""
@@ -222,8 +264,8 @@ class TrayHandler:
         # Reload icons in case they changed
         self._load_icons()
         
-        # Update current icon
-        self._update_icon()
+        # Update current icon and the source name shown in the menu
+        self._schedule_refresh()
         
         # Reload hotkeys with new settings
         self.reload_hotkeys()
@@ -242,16 +284,12 @@ class TrayHandler:
             subprocess.Popen([sys.executable, "test_connection.py"], 
                            creationflags=subprocess.CREATE_NEW_CONSOLE if hasattr(subprocess, 'CREATE_NEW_CONSOLE') else 0)
         except Exception as e:
-            self.logger.error(f"Error running connection test: {e}")
+            self.logger.error("Error running connection test: %s", e)
     
     def _on_about(self, icon, item):
         """Show about dialog."""
-        import tkinter as tk
         from tkinter import messagebox
         
-        root = tk.Tk()
-        root.withdraw()
-        
         about_text = """OBS VirtualCam Tray Controller v1.0
 
 A professional system tray application for controlling OBS source visibility via WebSocket.
@@ -265,11 +303,26 @@ Features:
 
 GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
         
-        messagebox.showinfo("About", about_text)
-        root.destroy()
+        messagebox.showinfo("About", about_text, parent=self._get_tk_root())
+    
+    def _get_tk_root(self) -> "tk.Tk":
+        """
+        Get the hidden Tk root used as parent for dialogs.
+        
+        Created on first use and kept, so each dialog doesn't start a new Tcl interpreter.
+        """
+        if self._tk_root is None:
+            import tkinter as tk
+            
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+            self._tk_root_thread = threading.get_ident()
+        return self._tk_root
     
     def _on_github(self, icon, item):
         """Open GitHub repository."""
+        import webbrowser
+        
         webbrowser.open("https://github.com/your-username/OBS-WebCam-SystemTray-Toggle")
     
     def _on_exit(self, icon, item):
@@ -277,73 +330,6 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
         self.logger.info("Exit requested from tray menu")
         self.stop()
     
-    def _create_main_menu(self) -> pystray.Menu:
-        """Create the main menu (left-click menu)."""
-        settings = self.settings_manager.settings
-        
-        # Connection section
-        if self.current_connection_state:
-            connection_item = pystray.MenuItem("✅ Disconnect from OBS", self._on_disconnect)
-        else:
-            connection_item = pystray.MenuItem("🔌 Connect to OBS", self._on_connect)
-        
-        # Webcam control section
-        if not self.current_connection_state:
-            # Not connected - show disabled webcam controls
-            webcam_on_item = pystray.MenuItem("Turn On Webcam", self._on_webcam_on, enabled=False)
-            webcam_off_item = pystray.MenuItem("Turn Off Webcam", self._on_webcam_off, enabled=False)
-            status_item = pystray.MenuItem("❌ Not connected to OBS", None, enabled=False)
-        else:
-            # Connected - show appropriate controls
-            if self.current_webcam_state is None:
-                # State unknown
-                webcam_on_item = pystray.MenuItem("Turn On Webcam", self._on_webcam_on, enabled=True)
-                webcam_off_item = pystray.MenuItem("Turn Off Webcam", self._on_webcam_off, enabled=True)
-                status_item = pystray.MenuItem("❓ Webcam state unknown", self._refresh_webcam_state)
-            elif self.current_webcam_state:
-                # Webcam is on
-                webcam_on_item = pystray.MenuItem("✅ Turn On Webcam", self._on_webcam_on, enabled=False)
-                webcam_off_item = pystray.MenuItem("Turn Off Webcam", self._on_webcam_off, enabled=True)
-                status_item = pystray.MenuItem(f"🎥 {settings.source_name}: ON", None, enabled=False)
-            else:
-                # Webcam is off
-                webcam_on_item = pystray.MenuItem("Turn On Webcam", self._on_webcam_on, enabled=True)
-                webcam_off_item = pystray.MenuItem("❌ Turn Off Webcam", self._on_webcam_off, enabled=False)
-                status_item = pystray.MenuItem(f"📴 {settings.source_name}: OFF", None, enabled=False)
-        
-        return pystray.Menu(
-            connection_item,
-            pystray.Menu.SEPARATOR,
-            status_item,
-            webcam_on_item,
-            webcam_off_item,
-            pystray.MenuItem("🔄 Refresh State", self._refresh_webcam_state, enabled=self.current_connection_state),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Exit", self._on_exit)
-        )
-    
-    def _create_settings_menu(self) -> pystray.Menu:
-        """Create the settings menu (right-click menu)."""
-        return pystray.Menu(
-            pystray.MenuItem("⚙️ Settings", self._on_settings),
-            pystray.MenuItem("🔧 Test Connection", self._on_test_connection),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("ℹ️ About", self._on_about),
-            pystray.MenuItem("🌐 GitHub", self._on_github),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Exit", self._on_exit)
-        )
-    
-    def _show_main_menu(self, icon, item):
-        """Show main menu - called on left click."""
-        pass  # Menu is already set as default
-    
-    def _show_settings_menu(self, icon, item):
-        """Show settings menu - called on right click."""
-        # Update the menu to settings menu temporarily
-        if self.icon:
-            self.icon.menu = self._create_settings_menu()
-    
     def _update_icon(self):
         """Update the tray icon based on connection and webcam state."""
         if self.icon is None:
@@ -368,7 +354,36 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
                 self.logger.debug("Updated tray icon to connected but unknown state")
                 
         except Exception as e:
-            self.logger.error(f"Error updating tray icon: {e}")
+            self.logger.error("Error updating tray icon: %s", e)
+    
+    def _schedule_refresh(self):
+        """Ask the refresh worker to redraw the icon and menu, starting it on first use."""
+        with self._refresh_lock:
+            if self._refresh_thread is None:
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh_loop, name="TrayRefresh", daemon=True
+                )
+                self._refresh_thread.start()
+        self._refresh_requested.set()
+    
+    def _refresh_loop(self):
+        """
+        Redraw the tray whenever a refresh is requested, until stop().
+        
+        Requests arriving within REFRESH_DELAY of each other are drawn together.
+        """
+        while True:
+            self._refresh_requested.wait()
+            # Let a burst of state changes settle; returns True once stopped
+            if self._refresh_stopped.wait(self.REFRESH_DELAY):
+                return
+            self._refresh_requested.clear()
+            self._refresh()
+    
+    def _refresh(self):
+        """Update the tray icon and menu to the current state."""
+        self._update_icon()
+        self._update_menus()
     
     def _update_menus(self):
         """Update menu items based on current state."""
@@ -376,12 +391,12 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
             return
             
         try:
-            # Update the combined menu
-            self.icon.menu = self._create_combined_menu()
+            # Re-evaluate the menu item texts and enabled states
+            self.icon.update_menu()
             self.logger.debug("Updated tray menus")
             
         except Exception as e:
-            self.logger.error(f"Error updating menus: {e}")
+            self.logger.error("Error updating menus: %s", e)
     
     def update_connection_state(self, connected: bool):
         """
@@ -390,12 +405,7 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
         Args:
             connected: True if connected to OBS, False otherwise
         """
-        if self.current_connection_state != connected:
-            self.current_connection_state = connected
-            if not connected:
-                self.current_webcam_state = None
-            self._update_icon()
-            self._update_menus()
+        self._set_connection_state(connected)
     
     def update_webcam_state(self, webcam_state: Optional[bool]):
         """
@@ -404,19 +414,45 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
         Args:
             webcam_state: True if webcam on, False if off, None if unknown
         """
-        if self.current_webcam_state != webcam_state:
-            self.current_webcam_state = webcam_state
-            self._update_icon()
-            self._update_menus()
+        self._set_webcam_state(webcam_state)
+    
+    def _set_connection_state(self, connected: bool):
+        """
+        Set the connection state, refreshing the tray only if it changed.
+        
+        Args:
+            connected: True if connected to OBS, False otherwise
+        """
+        if self.current_connection_state == connected:
+            return
+        self.current_connection_state = connected
+        if not connected:
+            self.current_webcam_state = None
+        self._schedule_refresh()
+    
+    def _set_webcam_state(self, webcam_state: Optional[bool]):
+        """
+        Set the webcam state, refreshing the tray only if it changed.
+        
+        Args:
+            webcam_state: True if webcam on, False if off, None if unknown
+        """
+        if self.current_webcam_state == webcam_state:
+            return
+        self.current_webcam_state = webcam_state
+        self._schedule_refresh()
     
     def start(self):
         """Start the system tray icon."""
         try:
+            if self._stopped:
+                return
+            
             # Start the hotkey handler
             self.hotkey_handler.start()
             
             # Create icon with initial state
-            self.icon = pystray.Icon(
+            icon = pystray.Icon(
                 "OBS VirtualCam Tray Controller",
                 self.disconnected_icon,
                 "OBS VirtualCam Tray Controller - Starting...",
@@ -424,60 +460,46 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
             )
             
             # Set left-click to show main menu (default behavior)
-            self.icon.default_action = None
+            icon.default_action = None
+            
+            # Publish the icon unless stop() already ran, which would then never stop it
+            with self._icon_lock:
+                if self._stopped:
+                    self.hotkey_handler.stop()
+                    self.logger.info("Stop requested during startup, not showing tray icon")
+                    return
+                self.icon = icon
             
             # Start the icon (this blocks until icon.stop() is called)
             self.logger.info("Starting system tray icon")
-            self.icon.run()
+            icon.run()
             
         except Exception as e:
-            self.logger.error(f"Error running tray icon: {e}")
+            self.logger.error("Error running tray icon: %s", e)
     
     def _create_combined_menu(self) -> pystray.Menu:
-        """Create a combined menu with all options."""
-        settings = self.settings_manager.settings
-        
-        # Connection section
-        if self.current_connection_state:
-            connection_item = pystray.MenuItem("✅ Disconnect from OBS", self._on_disconnect)
-        else:
-            connection_item = pystray.MenuItem("🔌 Connect to OBS", self._on_connect)
-        
-        # Webcam control section
-        if not self.current_connection_state:
-            # Not connected - show disabled webcam controls
-            webcam_on_item = pystray.MenuItem("Turn On Webcam", self._on_webcam_on, enabled=False)
-            webcam_off_item = pystray.MenuItem("Turn Off Webcam", self._on_webcam_off, enabled=False)
-            status_item = pystray.MenuItem("❌ Not connected to OBS", None, enabled=False)
-        else:
-            # Connected - show appropriate controls
-            if self.current_webcam_state is None:
-                # State unknown
-                webcam_on_item = pystray.MenuItem("Turn On Webcam", self._on_webcam_on, enabled=True)
-                webcam_off_item = pystray.MenuItem("Turn Off Webcam", self._on_webcam_off, enabled=True)
-                status_item = pystray.MenuItem("❓ Webcam state unknown", self._refresh_webcam_state)
-            elif self.current_webcam_state:
-                # Webcam is on
-                webcam_on_item = pystray.MenuItem("✅ Turn On Webcam", self._on_webcam_on, enabled=False)
-                webcam_off_item = pystray.MenuItem("Turn Off Webcam", self._on_webcam_off, enabled=True)
-                status_item = pystray.MenuItem(f"🎥 {settings.source_name}: ON", None, enabled=False)
-            else:
-                # Webcam is off
-                webcam_on_item = pystray.MenuItem("Turn On Webcam", self._on_webcam_on, enabled=True)
-                webcam_off_item = pystray.MenuItem("❌ Turn Off Webcam", self._on_webcam_off, enabled=False)
-                status_item = pystray.MenuItem(f"📴 {settings.source_name}: OFF", None, enabled=False)
+        """
+        Create a combined menu with all options.
         
-        # Create the combined menu
+        Item texts and enabled states are callables evaluated against the current
+        state, so the menu is built once and only refreshed with icon.update_menu().
+        """
         return pystray.Menu(
             # Connection section
-            connection_item,
+            pystray.MenuItem(self._connection_text, self._on_toggle_connection),
             pystray.Menu.SEPARATOR,
             
             # Webcam controls section
-            status_item,
-            webcam_on_item,
-            webcam_off_item,
-            pystray.MenuItem("🔄 Refresh State", self._refresh_webcam_state, enabled=self.current_connection_state),
+            pystray.MenuItem(self._status_text, self._refresh_webcam_state,
+                             enabled=lambda item: self.current_connection_state and self.current_webcam_state is None),
+            pystray.MenuItem(lambda item: "✅ Turn On Webcam" if self.current_webcam_state is True else "Turn On Webcam",
+                             self._on_webcam_on,
+                             enabled=lambda item: self.current_connection_state and self.current_webcam_state is not True),
+            pystray.MenuItem(lambda item: "❌ Turn Off Webcam" if self.current_webcam_state is False else "Turn Off Webcam",
+                             self._on_webcam_off,
+                             enabled=lambda item: self.current_connection_state and self.current_webcam_state is not False),
+            pystray.MenuItem("🔄 Refresh State", self._refresh_webcam_state,
+                             enabled=lambda item: self.current_connection_state),
             
             pystray.Menu.SEPARATOR,
             
@@ -497,19 +519,47 @@ GitHub: https://github.com/your-username/OBS-WebCam-SystemTray-Toggle"""
             pystray.MenuItem("Exit", self._on_exit)
         )
     
+    def _connection_text(self, item) -> str:
+        """Get the connection menu item text for the current state."""
+        if self.current_connection_state:
+            return "✅ Disconnect from OBS"
+        return "🔌 Connect to OBS"
+    
+    def _status_text(self, item) -> str:
+        """Get the webcam status menu item text for the current state."""
+        if not self.current_connection_state:
+            return "❌ Not connected to OBS"
+        if self.current_webcam_state is None:
+            return "❓ Webcam state unknown"
+        source_name = self.settings_manager.settings.source_name
+        if self.current_webcam_state:
+            return f"🎥 {source_name}: ON"
+        return f"📴 {source_name}: OFF"
+    
     def stop(self):
         """Stop the system tray icon."""
         try:
             # Stop the hotkey handler
             self.hotkey_handler.stop()
             
-            if self.icon:
-                self.icon.stop()
-                self.icon = None
+            # Wake the refresh worker so it can exit
+            self._refresh_stopped.set()
+            self._refresh_requested.set()
+            
+            with self._icon_lock:
+                self._stopped = True
+                icon, self.icon = self.icon, None
+            if icon:
+                icon.stop()
+            
+            # Tk may only be torn down from the thread that created it
+            if self._tk_root is not None and self._tk_root_thread == threading.get_ident():
+                self._tk_root.destroy()
+                self._tk_root = None
                 
             self.logger.info("Tray icon stopped")
         except Exception as e:
-            self.logger.error(f"Error stopping tray icon: {e}")
+            self.logger.error("Error stopping tray icon: %s", e)
     
     def is_running(self) -> bool:
         """Check if the tray icon is running."""
@@ -0,0 +1,90 @@
+"""
+Scene item id cache for the manual test scripts.
+
+Scene item ids stay the same until the item is removed from its scene, so a
+repeated connection test can check the cached item directly instead of
+listing every item in the scene. Ids are kept per OBS server, and callers
+still confirm that a cached id names the expected source.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+CACHE_FILE = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    / 'obs-tray-toggle' / 'item_ids.json'
+)
+
+
+def _read_cache() -> dict:
+    """
+    Read the cache file.
+    
+    Returns:
+        Cached ids as {"host:port": {scene_name: {source_name: scene_item_id}}},
+        empty if the file is missing or unreadable
+    """
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _server_key(host: str, port: int) -> str:
+    """Get the cache key of an OBS server."""
+    return f"{host}:{port}"
+
+
+def load_item_id(host: str, port: int, scene_name: str, source_name: str) -> Optional[int]:
+    """
+    Get the cached scene item id of a source.
+    
+    Args:
+        host: OBS WebSocket host
+        port: OBS WebSocket port
+        scene_name: Name of the scene
+        source_name: Name of the source in the scene
+        
+    Returns:
+        Cached scene item id, or None if not cached
+    """
+    server = _read_cache().get(_server_key(host, port))
+    scene = server.get(scene_name) if isinstance(server, dict) else None
+    item_id = scene.get(source_name) if isinstance(scene, dict) else None
+    return item_id if isinstance(item_id, int) else None
+
+
+def store_item_id(host: str, port: int, scene_name: str, source_name: str, item_id: int) -> bool:
+    """
+    Cache the scene item id of a source.
+    
+    Args:
+        host: OBS WebSocket host
+        port: OBS WebSocket port
+        scene_name: Name of the scene
+        source_name: Name of the source in the scene
+        item_id: Scene item id to cache
+        
+    Returns:
+        True if the id is cached, False if the cache could not be written
+    """
+    data = _read_cache()
+    server = data.get(_server_key(host, port))
+    if not isinstance(server, dict):
+        server = data[_server_key(host, port)] = {}
+    scene = server.get(scene_name)
+    if not isinstance(scene, dict):
+        scene = server[scene_name] = {}
+    if scene.get(source_name) == item_id:
+        return True
+    scene[source_name] = item_id
+    
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,110 @@
+"""
+Shared OBS WebSocket connection for the manual test scripts.
+"""
+
+import atexit
+import contextlib
+import json
+import random
+import socket
+import time
+import types
+
+import obsws_python as obs
+import obsws_python.baseclient
+from websocket import WebSocketTimeoutException
+
+# orjson is optional; the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # WebSocket frames are text, so encoded JSON is decoded back to str
+    json_codec = types.SimpleNamespace(
+        loads=orjson.loads,
+        dumps=lambda obj: orjson.dumps(obj).decode('utf-8'),
+        decoder=json.decoder,
+    )
+    # Decode obsws-python's frames with orjson as well
+    obsws_python.baseclient.json = json_codec
+else:
+    json_codec = json
+
+# Local obs-websocket handshakes finish well under a second
+CONNECT_TIMEOUT = 2.0
+CONNECT_ATTEMPTS = 4
+
+# Errors worth retrying; timeouts count as connectivity failures
+_RETRYABLE_ERRORS = (ConnectionError, socket.timeout, TimeoutError, WebSocketTimeoutException)
+
+# No socket tuning is needed: websocket-client already enables TCP_NODELAY
+# (websocket.DEFAULT_SOCKET_OPTION), so back-to-back requests skip Nagle delays
+
+# Open clients keyed by (host, port, password)
+_clients = {}
+
+
+@contextlib.contextmanager
+def obs_session(settings):
+    """
+    Provide a connected OBS request client.
+    
+    The connection is kept open after the block exits so later sessions
+    with the same settings skip the WebSocket and authentication handshake.
+    A client whose block raised is closed, since its state is unknown.
+    
+    Args:
+        settings: Settings with the OBS host, port and password
+        
+    Yields:
+        Connected obs.ReqClient
+    """
+    key = (settings.obs_host, settings.obs_port, settings.obs_password)
+    client = _clients.get(key)
+    if client is None:
+        client = _connect(settings)
+        _clients[key] = client
+    
+    try:
+        yield client
+    except BaseException:
+        _clients.pop(key, None)
+        client.disconnect()
+        raise
+
+
+def _connect(settings):
+    """
+    Connect to OBS, retrying transient failures with jittered backoff.
+    
+    Args:
+        settings: Settings with the OBS host, port and password
+        
+    Returns:
+        Connected obs.ReqClient
+    """
+    for attempt in range(CONNECT_ATTEMPTS):
+        try:
+            return obs.ReqClient(
+                host=settings.obs_host,
+                port=settings.obs_port,
+                password=settings.obs_password,
+                timeout=CONNECT_TIMEOUT
+            )
+        except _RETRYABLE_ERRORS:
+            if attempt == CONNECT_ATTEMPTS - 1:
+                raise
+            time.sleep(min(0.25 * 2 ** attempt, 2.0) + random.uniform(0, 0.25))
+
+
+@atexit.register
+def close_sessions():
+    """Disconnect all open OBS clients."""
+    while _clients:
+        _, client = _clients.popitem()
+        try:
+            client.disconnect()
+        except Exception:
+            pass
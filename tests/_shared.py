@@ -0,0 +1,25 @@
+"""
+Shared helpers for the manual test scripts.
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+# Make the project root importable when a test script is run directly
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from src.settings_manager import SettingsManager
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings_manager() -> SettingsManager:
+    """
+    Get the settings manager shared by the test scripts.
+    
+    Returns:
+        SettingsManager loaded once per process
+    """
+    return SettingsManager()
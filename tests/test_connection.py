@@ -4,22 +4,107 @@ OBS WebSocket Connection Test Script
 
 This script tests the connection to OBS Studio via WebSocket and verifies
 that the configured scene and source exist and are accessible.
+
+The test uses the same synchronous obsws-python client as the application.
+Independent queries are sent together as one request batch, so they cost a
+single round-trip without needing an async client.
 """
 
 import sys
+import time
 import logging
-from pathlib import Path
+from random import randint
+
+from _cache import load_item_id, store_item_id
+from _shared import get_settings_manager
+from _obs_session import json_codec, obs_session
+from obsws_python.error import OBSSDKRequestError
+from obsws_python.util import as_dataclass
+
+# Report separator lines
+_SEP = "=" * 40
+_DASH = "-" * 40
+
+# obs-websocket v5 RequestBatchExecutionType values
+SERIAL_REALTIME = 0
+SERIAL_FRAME = 1
+
+# obs-websocket v5 RequestStatus code for a missing scene or source
+RESOURCE_NOT_FOUND = 600
+
+# Seconds the whole test may take, however the OBS server behaves
+TEST_DEADLINE = 30.0
+
+
+def check_deadline(deadline):
+    """
+    Fail the test once its overall deadline has passed.
+    
+    Args:
+        deadline: time.monotonic() value the test must finish by
+        
+    Raises:
+        TimeoutError: If the deadline has passed
+    """
+    if time.monotonic() >= deadline:
+        raise TimeoutError("overall test deadline exceeded")
 
-# Add parent directory to path to access src module
-sys.path.append(str(Path(__file__).parent.parent))
 
-from src.settings_manager import SettingsManager
-import obsws_python as obs
+def send_batch(client, requests, execution_type=SERIAL_REALTIME, halt_on_failure=False):
+    """
+    Send several requests to OBS in a single WebSocket round-trip.
+    
+    obsws-python has no batch API, so the RequestBatch message (OpCode 8)
+    is written to the client's socket directly.
+    
+    Args:
+        client: Connected obs.ReqClient
+        requests: List of (request_type, request_data) tuples
+        execution_type: How OBS should execute the batch
+        halt_on_failure: Whether OBS should skip the remaining requests
+            after one fails
+        
+    Returns:
+        List of results in request order: a response dataclass, None for
+        requests without response data, or an OBSSDKRequestError for
+        requests that failed. Requests skipped after a failure have no
+        entry.
+    """
+    payload = {
+        "op": 8,
+        "d": {
+            "requestId": str(randint(1, 1000)),
+            "executionType": execution_type,
+            "haltOnFailure": halt_on_failure,
+            "requests": [
+                {"requestType": request_type, "requestData": request_data or {}}
+                for request_type, request_data in requests
+            ],
+        },
+    }
+    ws = client.base_client.ws
+    ws.send(json_codec.dumps(payload))
+    response = json_codec.loads(ws.recv())
+    
+    results = []
+    for result in response["d"]["results"]:
+        status = result["requestStatus"]
+        if not status["result"]:
+            results.append(OBSSDKRequestError(
+                result["requestType"], status["code"], status.get("comment")
+            ))
+        elif "responseData" in result:
+            results.append(as_dataclass(result["requestType"], result["responseData"]))
+        else:
+            results.append(None)
+    return results
 
 
 def main():
     """Test OBS WebSocket connection."""
     
+    deadline = time.monotonic() + TEST_DEADLINE
+    
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
@@ -27,110 +112,160 @@ def main():
     )
     logger = logging.getLogger(__name__)
     
-    logger.info("OBS WebSocket Connection Test")
-    logger.info("=" * 40)
-    
     # Load settings
-    settings_manager = SettingsManager()
+    settings_manager = get_settings_manager()
     settings = settings_manager.settings
     
-    logger.info(f"Testing connection to: {settings.obs_host}:{settings.obs_port}")
-    logger.info(f"Target scene: '{settings.scene_name}'")
-    logger.info(f"Target source: '{settings.source_name}'")
-    logger.info("-" * 40)
+    # Scene item id remembered from an earlier run against this server
+    cached_item_id = load_item_id(
+        settings.obs_host, settings.obs_port, settings.scene_name, settings.source_name
+    )
+    
+    logger.info("\n".join([
+        "OBS WebSocket Connection Test",
+        _SEP,
+        f"Testing connection to: {settings.obs_host}:{settings.obs_port}",
+        f"Target scene: '{settings.scene_name}'",
+        f"Target source: '{settings.source_name}'",
+        _DASH,
+    ]))
     
     try:
         # Connect to OBS
         logger.info("Connecting to OBS WebSocket...")
-        client = obs.ReqClient(
-            host=settings.obs_host,
-            port=settings.obs_port,
-            password=settings.obs_password,
-            timeout=10
-        )
-        
-        # Test basic connection
-        version_info = client.get_version()
-        logger.info("✅ Successfully connected to OBS!")
-        logger.info(f"   OBS Version: {version_info.obs_version}")
-        logger.info(f"   WebSocket Version: {version_info.obs_web_socket_version}")
-        logger.info(f"   Available Requests: {version_info.available_requests}")
-        
-        # Test scene existence
-        logger.info(f"\nChecking if scene '{settings.scene_name}' exists...")
-        scenes = client.get_scene_list()
-        scene_names = [scene['sceneName'] for scene in scenes.scenes]
-        
-        if settings.scene_name in scene_names:
-            logger.info(f"✅ Scene '{settings.scene_name}' found!")
-        else:
-            logger.error(f"❌ Scene '{settings.scene_name}' not found!")
-            logger.info(f"   Available scenes: {scene_names}")
-            return False
-            
-        # Test source existence in scene
-        logger.info(f"\nChecking if source '{settings.source_name}' exists in scene...")
-        scene_items = client.get_scene_item_list(settings.scene_name)
-        source_names = [item['sourceName'] for item in scene_items.scene_items]
+        check_deadline(deadline)
+        with obs_session(settings) as client:
+            # Query the version together with the cached item's source and state,
+            # or with the scene items when no item id is cached
+            if cached_item_id is not None:
+                cached_item = {"sceneName": settings.scene_name, "sceneItemId": cached_item_id}
+                lookups = [("GetSceneItemSource", cached_item), ("GetSceneItemEnabled", cached_item)]
+            else:
+                lookups = [("GetSceneItemList", {"sceneName": settings.scene_name})]
+            check_deadline(deadline)
+            version_info, *lookup_results = send_batch(client, [("GetVersion", None)] + lookups)
+            if isinstance(version_info, Exception):
+                raise version_info
         
-        if settings.source_name in source_names:
-            logger.info(f"✅ Source '{settings.source_name}' found in scene!")
+            # Test basic connection
+            logger.info("\n".join([
+                "✅ Successfully connected to OBS!",
+                f"   OBS Version: {version_info.obs_version}",
+                f"   WebSocket Version: {version_info.obs_web_socket_version}",
+                f"   Available Requests: {version_info.available_requests}",
+            ]))
             
-            # Find the source and get its current state
-            source_item_id = None
-            for item in scene_items.scene_items:
-                if item['sourceName'] == settings.source_name:
-                    source_item_id = item['sceneItemId']
-                    break
-            
-            if source_item_id is not None:
-                # Get current visibility state
-                item_enabled = client.get_scene_item_enabled(settings.scene_name, source_item_id)
-                state = "visible" if item_enabled.scene_item_enabled else "hidden"
-                logger.info(f"   Current state: {state}")
+            # The cached id is only trusted while it still names the configured source
+            cache_valid = (
+                cached_item_id is not None
+                and not any(isinstance(result, Exception) for result in lookup_results)
+                and lookup_results[0].source_name == settings.source_name
+            )
+            if cache_valid:
+                source_item_id = cached_item_id
+                item_enabled = lookup_results[1]
+                logger.info(
+                    f"\n✅ Scene '{settings.scene_name}' and source "
+                    f"'{settings.source_name}' found (cached item {source_item_id})!"
+                )
+            else:
+                if cached_item_id is None:
+                    scene_items, = lookup_results
+                else:
+                    # Stale cache entry; look the item up again
+                    check_deadline(deadline)
+                    scene_items, = send_batch(client, [
+                        ("GetSceneItemList", {"sceneName": settings.scene_name}),
+                    ])
                 
-                # Test toggle functionality
-                logger.info(f"\nTesting visibility toggle...")
+                # Test scene existence; listing scene items fails for a missing scene
+                logger.info(f"\nChecking if scene '{settings.scene_name}' exists...")
+                if isinstance(scene_items, OBSSDKRequestError) and scene_items.code == RESOURCE_NOT_FOUND:
+                    check_deadline(deadline)
+                    scenes = client.get_scene_list()
+                    scene_names = [scene['sceneName'] for scene in scenes.scenes]
+                    logger.error(f"❌ Scene '{settings.scene_name}' not found!")
+                    logger.info(f"   Available scenes: {scene_names}")
+                    return False
+                if isinstance(scene_items, Exception):
+                    raise scene_items
+                logger.info(f"✅ Scene '{settings.scene_name}' found!")
                 
-                # Toggle off
-                client.set_scene_item_enabled(settings.scene_name, source_item_id, False)
-                logger.info("✅ Source hidden successfully")
+                # Test source existence in scene
+                logger.info(f"\nChecking if source '{settings.source_name}' exists in scene...")
+                items_by_name = {
+                    item['sourceName']: item['sceneItemId'] for item in scene_items.scene_items
+                }
+                source_item_id = items_by_name.get(settings.source_name)
                 
-                # Toggle on
-                client.set_scene_item_enabled(settings.scene_name, source_item_id, True)
-                logger.info("✅ Source shown successfully")
+                if source_item_id is None:
+                    logger.error(f"❌ Source '{settings.source_name}' not found in scene!")
+                    logger.info(f"   Available sources: {list(items_by_name)}")
+                    return False
+                logger.info(f"✅ Source '{settings.source_name}' found in scene!")
+                store_item_id(
+                    settings.obs_host, settings.obs_port,
+                    settings.scene_name, settings.source_name, source_item_id
+                )
                 
-                # Restore original state
-                client.set_scene_item_enabled(settings.scene_name, source_item_id, item_enabled.scene_item_enabled)
-                logger.info("✅ Original state restored")
-                
-        else:
-            logger.error(f"❌ Source '{settings.source_name}' not found in scene!")
-            logger.info(f"   Available sources: {source_names}")
-            return False
+                check_deadline(deadline)
+                item_enabled = client.get_scene_item_enabled(settings.scene_name, source_item_id)
+            
+            # Get current visibility state
+            original_enabled = item_enabled.scene_item_enabled
+            state = "visible" if original_enabled else "hidden"
+            logger.info(f"   Current state: {state}")
+            
+            # Test toggle functionality: off, on, then restore, one per video
+            # frame so each change is actually rendered
+            logger.info(f"\nTesting visibility toggle...")
+            check_deadline(deadline)
+            toggle_results = send_batch(client, [
+                ("SetSceneItemEnabled", {
+                    "sceneName": settings.scene_name,
+                    "sceneItemId": source_item_id,
+                    "sceneItemEnabled": enabled,
+                })
+                for enabled in (False, True, original_enabled)
+            ], SERIAL_FRAME, halt_on_failure=True)
+            for result in toggle_results:
+                if isinstance(result, Exception):
+                    raise result
+            logger.info("\n".join([
+                "✅ Source hidden successfully",
+                "✅ Source shown successfully",
+                "✅ Original state restored",
+            ]))
         
-        logger.info("\n" + "=" * 40)
-        logger.info("🎉 All tests passed! OBS connection is working correctly.")
-        logger.info("\nYour configuration:")
-        logger.info(f"   Host: {settings.obs_host}")
-        logger.info(f"   Port: {settings.obs_port}")
-        logger.info(f"   Scene: {settings.scene_name}")
-        logger.info(f"   Source: {settings.source_name}")
-        logger.info("\nYou can now run the main application!")
-        return True
+            logger.info("\n".join([
+                "",
+                _SEP,
+                "🎉 All tests passed! OBS connection is working correctly.",
+                "",
+                "Your configuration:",
+                f"   Host: {settings.obs_host}",
+                f"   Port: {settings.obs_port}",
+                f"   Scene: {settings.scene_name}",
+                f"   Source: {settings.source_name}",
+                "",
+                "You can now run the main application!",
+            ]))
+            return True
         
     except ConnectionError as e:
-        logger.error(f"❌ Connection failed: {e}")
-        logger.error("\nTroubleshooting tips:")
-        logger.error("1. Make sure OBS Studio is running")
-        logger.error("2. Enable WebSocket server in OBS (Tools → WebSocket Server Settings)")
-        logger.error("3. Check that the host and port are correct")
-        logger.error("4. Verify the WebSocket password in settings")
+        logger.error("\n".join([
+            f"❌ Connection failed: {e}",
+            "",
+            "Troubleshooting tips:",
+            "1. Make sure OBS Studio is running",
+            "2. Enable WebSocket server in OBS (Tools → WebSocket Server Settings)",
+            "3. Check that the host and port are correct",
+            "4. Verify the WebSocket password in settings",
+        ]))
         return False
         
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"❌ Unexpected error: {e}\nError type: {type(e).__name__}")
         return False
 
 
@@ -6,15 +6,20 @@ This tests the hotkey system without requiring OBS to be running.
 
 import sys
 import logging
-from pathlib import Path
+import threading
 import time
 
-# Add parent directory to path to access src module
-sys.path.append(str(Path(__file__).parent.parent))
-
-from src.settings_manager import SettingsManager
+from _shared import get_settings_manager
 from src.hotkey_handler import HotkeyHandler
 
+# Report separator lines
+_SEP = "=" * 50
+_DASH = "-" * 50
+
+# Feedback written straight to stdout from the hotkey listener thread
+_MSG_ON = "🟢 HOTKEY ACTIVATED: Webcam ON\n💡 This would turn your webcam ON in the real app!\n"
+_MSG_OFF = "🔴 HOTKEY ACTIVATED: Webcam OFF\n💡 This would turn your webcam OFF in the real app!\n"
+
 
 def main():
     """Test the hotkey functionality."""
@@ -26,17 +31,18 @@ def main():
     )
     logger = logging.getLogger(__name__)
     
-    logger.info("🎹 OBS Tray Controller - Hotkey Test")
-    logger.info("=" * 50)
-    
     # Load settings
-    settings_manager = SettingsManager()
+    settings_manager = get_settings_manager()
     settings = settings_manager.settings
     
-    logger.info(f"Hotkeys enabled: {settings.enable_hotkeys}")
-    logger.info(f"Webcam ON hotkey: {settings.hotkey_webcam_on}")
-    logger.info(f"Webcam OFF hotkey: {settings.hotkey_webcam_off}")
-    logger.info("-" * 50)
+    logger.info("\n".join([
+        "🎹 OBS Tray Controller - Hotkey Test",
+        _SEP,
+        f"Hotkeys enabled: {settings.enable_hotkeys}",
+        f"Webcam ON hotkey: {settings.hotkey_webcam_on}",
+        f"Webcam OFF hotkey: {settings.hotkey_webcam_off}",
+        _DASH,
+    ]))
     
     if not settings.enable_hotkeys:
         logger.warning("⚠️  Hotkeys are disabled in settings!")
@@ -45,12 +51,12 @@ def main():
     
     # Create test callbacks
     def on_webcam_on():
-        logger.info("🟢 HOTKEY ACTIVATED: Webcam ON")
-        print("💡 This would turn your webcam ON in the real app!")
+        sys.stdout.write(_MSG_ON)
+        sys.stdout.flush()
     
     def on_webcam_off():
-        logger.info("🔴 HOTKEY ACTIVATED: Webcam OFF")
-        print("💡 This would turn your webcam OFF in the real app!")
+        sys.stdout.write(_MSG_OFF)
+        sys.stdout.flush()
     
     # Create hotkey handler
     hotkey_handler = HotkeyHandler(settings_manager)
@@ -62,19 +68,25 @@ def main():
     # Start the hotkey handler
     logger.info("🚀 Starting hotkey listener...")
     if hotkey_handler.start():
-        logger.info("✅ Hotkey listener started successfully!")
-        logger.info("")
-        logger.info("🎯 TEST YOUR HOTKEYS NOW:")
-        logger.info(f"   Press {settings.hotkey_webcam_on} to trigger 'Webcam ON'")
-        logger.info(f"   Press {settings.hotkey_webcam_off} to trigger 'Webcam OFF'")
-        logger.info("")
-        logger.info("Press Ctrl+C to stop the test")
-        logger.info("-" * 50)
+        logger.info("\n".join([
+            "✅ Hotkey listener started successfully!",
+            "",
+            "🎯 TEST YOUR HOTKEYS NOW:",
+            f"   Press {settings.hotkey_webcam_on} to trigger 'Webcam ON'",
+            f"   Press {settings.hotkey_webcam_off} to trigger 'Webcam OFF'",
+            "",
+            "Press Ctrl+C to stop the test",
+            _DASH,
+        ]))
         
         try:
-            # Keep the program running
-            while True:
-                time.sleep(1)
+            # Keep the program running without waking up until Ctrl+C.
+            # Untimed lock waits ignore Ctrl+C on Windows, but sleep does not.
+            if sys.platform == "win32":
+                while True:
+                    time.sleep(3600)
+            else:
+                threading.Event().wait()
                 
         except KeyboardInterrupt:
             logger.info("\n🛑 Test stopped by user")